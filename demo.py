@@ -6,30 +6,26 @@ This script demonstrates the full capability of the orchestrator system
 on different types of repositories and tasks.
 """
 
+import argparse
+import atexit
+import concurrent.futures
+import functools
+import hashlib
+import io
+import os
 import sys
+import tarfile
 import tempfile
+import threading
 import shutil
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from repo_analyzer import RepoAnalyzer
-from orchestrator_config import OrchestratorConfig
-
-
-def create_demo_python_project():
-    """Create a demo Python project for demonstration."""
-    
-    temp_dir = Path(tempfile.mkdtemp())
-    
-    # Create a simple Python web API project structure
-    (temp_dir / "app").mkdir()
-    (temp_dir / "tests").mkdir()
-    
+# Files making up the demo Python web API project, keyed by relative path
+_DEMO_FILES = {
     # Main application file
-    (temp_dir / "app" / "__init__.py").write_text("")
-    (temp_dir / "app" / "main.py").write_text('''
+    "app/__init__.py": "",
+    "app/main.py": '''
 """Main FastAPI application."""
 
 from fastapi import FastAPI, HTTPException
@@ -79,55 +75,50 @@ def delete_user(user_id: int):
         raise HTTPException(status_code=404, detail="User not found")
     del users_db[user_id]
     return {"message": "User deleted successfully"}
-''')
-    
+''',
     # Utils module
-    (temp_dir / "app" / "utils.py").write_text('''
+    "app/utils.py": '''
 """Utility functions."""
 
 import re
 from typing import Optional
 
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}$')
+
+# Upper age bounds (exclusive) for each demographic group
+_AGE_GROUPS = ((18, "minor"), (65, "adult"))
+
 def validate_email(email: str) -> bool:
     """Validate email format."""
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return re.match(pattern, email) is not None
+    return _EMAIL_RE.match(email) is not None
 
 def calculate_age_group(age: int) -> str:
     """Calculate age group for demographics."""
-    if age < 18:
-        return "minor"
-    elif age < 65:
-        return "adult"
-    else:
-        return "senior"
+    return next((group for bound, group in _AGE_GROUPS if age < bound), "senior")
 
 def format_user_display_name(name: str) -> str:
     """Format user name for display."""
     return name.title().strip()
-''')
-    
+''',
     # Basic test file
-    (temp_dir / "tests" / "__init__.py").write_text("")
-    (temp_dir / "tests" / "test_main.py").write_text('''
+    "tests/__init__.py": "",
+    "tests/test_main.py": '''
 """Basic tests for main module."""
 
 def test_placeholder():
     """Placeholder test - needs implementation."""
     assert True
-''')
-    
+''',
     # Requirements file
-    (temp_dir / "requirements.txt").write_text('''
+    "requirements.txt": '''
 fastapi>=0.68.0
 uvicorn>=0.15.0
 pydantic>=1.8.0
 pytest>=6.0.0
 httpx>=0.24.0
-''')
-    
+''',
     # Basic README
-    (temp_dir / "README.md").write_text('''
+    "README.md": '''
 # User Management API
 
 A simple FastAPI application for managing users.
@@ -153,40 +144,152 @@ A simple FastAPI application for managing users.
 - Add input validation
 - Add error handling
 - Add logging
-''')
+''',
+}
+
+
+def _build_demo_tar(files: dict) -> bytes:
+    """Pack the demo files into an uncompressed, deterministic tar archive."""
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w", format=tarfile.GNU_FORMAT) as tf:
+        for rel_path, content in files.items():
+            data = content.encode("utf-8")
+            info = tarfile.TarInfo(rel_path)
+            info.size = len(data)
+            info.mode = 0o644
+            info.mtime = 0
+            tf.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+# Built once at import so creating the project is a single extraction pass
+_DEMO_TAR_BYTES = _build_demo_tar(_DEMO_FILES)
+
+# Content hash of the demo sources, used to key the on-disk cache
+_DEMO_HASH = hashlib.blake2b(_DEMO_TAR_BYTES, digest_size=8).hexdigest()
+_DEMO_CACHE_PREFIX = "orc-demo-"
+# Written last into a cached tree; holds _DEMO_HASH once extraction has finished
+_DEMO_STAMP = ".orc-demo-complete"
+
+# Removes uncached demo trees off the main thread; drained at interpreter exit
+_CLEANUP_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="demo-rm")
+atexit.register(_CLEANUP_POOL.shutdown, wait=True)
+
+
+def _ramdisk_tmpdir():
+    """Return a RAM-backed temp directory if opted in via ORCHESTRATOR_DEMO_RAMDISK=1.
     
-    return temp_dir
+    Returns None (the platform default temp dir) when not enabled or when
+    /dev/shm is unavailable.
+    """
+    if os.getenv("ORCHESTRATOR_DEMO_RAMDISK") != "1":
+        return None
+    if os.path.isdir("/dev/shm") and os.access("/dev/shm", os.W_OK):
+        return "/dev/shm"
+    return None
+
+
+def _demo_tmp_root() -> Path:
+    return Path(_ramdisk_tmpdir() or tempfile.gettempdir())
+
+
+def _demo_cache_dir() -> Path:
+    """Location of the cached demo project for the current sources."""
+    return _demo_tmp_root() / f"{_DEMO_CACHE_PREFIX}{_DEMO_HASH}"
 
 
-def demo_repository_analysis():
+def _extract_demo_project(target_dir: Path) -> None:
+    with tarfile.open(fileobj=io.BytesIO(_DEMO_TAR_BYTES), mode="r:") as tf:
+        tf.extractall(target_dir, filter="data")
+
+
+def _is_complete_cache(target: Path) -> bool:
+    """Whether target holds a fully extracted tree of the current demo sources."""
+    try:
+        return (target / _DEMO_STAMP).read_text(encoding="utf-8") == _DEMO_HASH
+    except OSError:
+        return False
+
+
+def create_demo_python_project(use_cache: bool = True):
+    """Create a demo Python project for demonstration.
+    
+    Args:
+        use_cache: Reuse the tree cached under the temp directory when the
+            demo sources are unchanged. If False, a fresh temporary directory
+            is created and the caller is responsible for removing it.
+    """
+    if not use_cache:
+        temp_dir = Path(tempfile.mkdtemp(dir=_ramdisk_tmpdir()))
+        _extract_demo_project(temp_dir)
+        return temp_dir
+    
+    target = _demo_cache_dir()
+    if _is_complete_cache(target):
+        return target
+    
+    # Unpack next to the target, stamp it and rename, so a partial tree is never
+    # reused; a leftover tree without the stamp is discarded and rebuilt
+    staging = Path(tempfile.mkdtemp(prefix=f"{target.name}.", suffix=".tmp", dir=target.parent))
+    try:
+        _extract_demo_project(staging)
+        (staging / _DEMO_STAMP).write_text(_DEMO_HASH, encoding="utf-8")
+        if target.exists() and not _is_complete_cache(target):
+            shutil.rmtree(target, ignore_errors=True)
+        os.rename(staging, target)
+    except OSError:
+        # Another run populated the cache first
+        shutil.rmtree(staging, ignore_errors=True)
+        if not _is_complete_cache(target):
+            raise
+    
+    return target
+
+
+def clean_demo_cache() -> int:
+    """Remove all cached demo projects. Returns the number of trees removed."""
+    removed = 0
+    roots = {Path(tempfile.gettempdir()), _demo_tmp_root()}
+    for root in roots:
+        for cached in root.glob(f"{_DEMO_CACHE_PREFIX}*"):
+            if cached.is_dir():
+                shutil.rmtree(cached, ignore_errors=True)
+                removed += 1
+    return removed
+
+
+def demo_repository_analysis(use_cache: bool = True):
     """Demonstrate repository analysis capabilities."""
+    from repo_analyzer import RepoAnalyzer
     
     print("🔍 Repository Analysis Demo")
     print("=" * 50)
     
-    # Create demo project
-    demo_project = create_demo_python_project()
+    # Create demo project (reused from the cache when available)
+    demo_project = create_demo_python_project(use_cache=use_cache)
     
     try:
-        print(f"📁 Created demo project at: {demo_project}")
+        print(f"📁 Using demo project at: {demo_project}")
         
         # Analyze the repository
         analyzer = RepoAnalyzer(demo_project)
         analyzer.analyze()
         
     finally:
-        # Clean up
-        shutil.rmtree(demo_project)
-        print(f"🧹 Cleaned up demo project")
+        # Clean up only uncached trees; cached ones are kept for the next run
+        if not use_cache:
+            _CLEANUP_POOL.submit(shutil.rmtree, demo_project, ignore_errors=True)
+            print(f"🧹 Scheduled cleanup of demo project")
 
 
 def demo_configuration_system():
     """Demonstrate configuration management."""
+    from orchestrator_config import OrchestratorConfig
     
     print("\n⚙️  Configuration System Demo")
     print("=" * 50)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
+    with tempfile.TemporaryDirectory(dir=_ramdisk_tmpdir()) as temp_dir:
         config_file = Path(temp_dir) / "demo_config.json"
         
         # Create and configure
@@ -211,48 +314,49 @@ def demo_configuration_system():
         print("✅ Configuration persistence verified")
 
 
+# Example tasks shown by demo_task_suggestions, grouped by project type
+_PROJECT_TYPES = {
+    "Python FastAPI Project": (
+        "Add comprehensive pytest tests for all API endpoints with proper mocking",
+        "Add input validation using Pydantic models with custom validators",
+        "Implement async database operations using SQLAlchemy and asyncpg",
+        "Add authentication middleware with JWT tokens and refresh tokens",
+        "Add comprehensive logging with structured logging and request tracing"
+    ),
+    "React TypeScript Project": (
+        "Add React Testing Library tests for all components with user interaction testing",
+        "Implement Redux Toolkit for state management with proper TypeScript types",
+        "Add Storybook for component documentation and visual testing",
+        "Implement error boundaries for better error handling and user experience",
+        "Add accessibility improvements with proper ARIA labels and keyboard navigation"
+    ),
+    "Java Spring Boot Project": (
+        "Add JUnit 5 tests with TestContainers for integration testing",
+        "Implement Spring Security with OAuth2 and JWT authentication",
+        "Add Spring Data JPA repositories with custom queries and specifications",
+        "Implement proper exception handling with @ControllerAdvice",
+        "Add comprehensive API documentation using SpringDoc OpenAPI"
+    )
+}
+
+
 def demo_task_suggestions():
     """Demonstrate task suggestions for different project types."""
     
-    print("\n💡 Task Suggestions Demo")
-    print("=" * 50)
+    # Build the whole section and emit it with a single write
+    lines = ["\n💡 Task Suggestions Demo", "=" * 50]
     
-    project_types = {
-        "Python FastAPI Project": [
-            "Add comprehensive pytest tests for all API endpoints with proper mocking",
-            "Add input validation using Pydantic models with custom validators",
-            "Implement async database operations using SQLAlchemy and asyncpg",
-            "Add authentication middleware with JWT tokens and refresh tokens",
-            "Add comprehensive logging with structured logging and request tracing"
-        ],
-        "React TypeScript Project": [
-            "Add React Testing Library tests for all components with user interaction testing",
-            "Implement Redux Toolkit for state management with proper TypeScript types",
-            "Add Storybook for component documentation and visual testing",
-            "Implement error boundaries for better error handling and user experience",
-            "Add accessibility improvements with proper ARIA labels and keyboard navigation"
-        ],
-        "Java Spring Boot Project": [
-            "Add JUnit 5 tests with TestContainers for integration testing",
-            "Implement Spring Security with OAuth2 and JWT authentication",
-            "Add Spring Data JPA repositories with custom queries and specifications",
-            "Implement proper exception handling with @ControllerAdvice",
-            "Add comprehensive API documentation using SpringDoc OpenAPI"
-        ]
-    }
+    for project_type, tasks in _PROJECT_TYPES.items():
+        lines.append(f"\n🏗️  {project_type}:")
+        lines.extend(f"  {i}. {task}" for i, task in enumerate(tasks, 1))
     
-    for project_type, tasks in project_types.items():
-        print(f"\n🏗️  {project_type}:")
-        for i, task in enumerate(tasks, 1):
-            print(f"  {i}. {task}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def demo_cli_commands():
     """Show example CLI commands for different scenarios."""
     
-    print("\n🚀 CLI Commands Demo")
-    print("=" * 50)
-    
     commands = [
         ("Basic usage", 'python3 orchestrator_cli.py "Add unit tests for the user management module"'),
         ("Different directory", 'python3 orchestrator_cli.py "Fix authentication bugs" --directory /path/to/project'),
@@ -263,30 +367,113 @@ def demo_cli_commands():
         ("Configuration", 'python3 orchestrator_config.py --show'),
     ]
     
+    # Build the whole section and emit it with a single write
+    lines = ["\n🚀 CLI Commands Demo", "=" * 50]
     for description, command in commands:
-        print(f"\n{description}:")
-        print(f"  {command}")
+        lines.append(f"\n{description}:\n  {command}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """Stand-in for sys.stdout that gives each capturing thread its own buffer.
+    
+    Threads that are not capturing write straight through to the real stream.
+    """
+    
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+    
+    def write(self, s: str) -> int:
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            return self._stream.write(s)
+        return buffer.write(s)
+    
+    def flush(self) -> None:
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+    
+    def capture(self, stage):
+        """Run stage, returning (captured_output, exception_or_None)."""
+        self._local.buffer = buffer = io.StringIO()
+        error = None
+        try:
+            stage()
+        except Exception as e:
+            error = e
+        finally:
+            self._local.buffer = None
+        return buffer.getvalue(), error
+
+
+def _run_stages_concurrently(stages) -> None:
+    """Run independent demo stages in parallel, printing their output in order."""
+    real_stdout = sys.stdout
+    proxy = _ThreadLocalStdout(real_stdout)
+    sys.stdout = proxy
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=len(stages), thread_name_prefix="demo-stage") as ex:
+            futures = [ex.submit(proxy.capture, stage) for stage in stages]
+            # Replay each stage's output once it and all earlier stages are done
+            for future in futures:
+                output, error = future.result()
+                real_stdout.write(output)
+                real_stdout.flush()
+                if error is not None:
+                    raise error
+    finally:
+        sys.stdout = real_stdout
 
 
 def main():
     """Run the complete demo."""
+    parser = argparse.ArgumentParser(description="Orchestrator multi-agent coding system demo")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Build the demo project in a fresh temporary directory and remove it afterwards"
+    )
+    parser.add_argument(
+        "--clean-demo-cache",
+        action="store_true",
+        help="Remove cached demo projects and exit"
+    )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run the demo stages one after another instead of concurrently"
+    )
+    args = parser.parse_args()
+    
+    if args.clean_demo_cache:
+        removed = clean_demo_cache()
+        print(f"🧹 Removed {removed} cached demo project(s)")
+        return 0
     
     print("🤖 Orchestrator Multi-Agent Coding System Demo")
     print("=" * 60)
     print("This demo shows how to use the orchestrator on your own repositories.")
     
-    try:
+    stages = (
         # Demo 1: Repository Analysis
-        demo_repository_analysis()
-        
+        functools.partial(demo_repository_analysis, use_cache=not args.no_cache),
         # Demo 2: Configuration System
-        demo_configuration_system()
-        
+        demo_configuration_system,
         # Demo 3: Task Suggestions
-        demo_task_suggestions()
-        
+        demo_task_suggestions,
         # Demo 4: CLI Commands
-        demo_cli_commands()
+        demo_cli_commands,
+    )
+    
+    try:
+        if args.sequential:
+            for stage in stages:
+                stage()
+        else:
+            _run_stages_concurrently(stages)
         
         print("\n" + "=" * 60)
         print("✅ Demo completed successfully!")
@@ -6,15 +6,6 @@ This example shows how to use the Orchestrator programmatically
 (without the CLI) to work on a repository.
 """
 
-import sys
-from pathlib import Path
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from src.agents.env_interaction.command_executor import LocalExecutor
-from orchestrator_standalone import StandaloneOrchestrator
-
 
 def run_orchestrator_on_repo(repo_path: str, task: str, model: str = "anthropic/claude-sonnet-4-20250514"):
     """
@@ -28,6 +19,10 @@ def run_orchestrator_on_repo(repo_path: str, task: str, model: str = "anthropic/
     Returns:
         Dictionary with execution results
     """
+    # Imported lazily so the orchestrator's LLM stack only loads when used
+    from src.agents.env_interaction.command_executor import LocalExecutor
+    from orchestrator_standalone import StandaloneOrchestrator
+    
     # Create local executor for the repository
     executor = LocalExecutor(working_directory=repo_path)
     
@@ -6,24 +6,61 @@ This example shows how to use the orchestrator on projects with multiple languag
 or when working across different types of codebases.
 """
 
+import itertools
 import sys
 from pathlib import Path
+from typing import Tuple
 
-# Add parent directory to path to import our orchestrator modules
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from orchestrator_standalone import StandaloneOrchestrator
-from src.agents.env_interaction.command_executor import LocalExecutor
-from repo_analyzer import RepoAnalyzer
+_CROSS_PLATFORM_TASKS: Tuple[str, ...] = (
+    # Documentation tasks
+    "Create comprehensive API documentation with examples and usage patterns",
+    "Add inline code documentation following language-specific conventions",
+    "Generate project documentation website with proper navigation and search",
+    
+    # Testing tasks
+    "Add comprehensive test suite with unit, integration, and end-to-end tests",
+    "Implement test data factories and fixtures for consistent testing",
+    "Add performance and load testing for critical application paths",
+    
+    # CI/CD tasks
+    "Set up GitHub Actions workflow with testing, linting, and deployment stages",
+    "Add Docker containerization with multi-stage builds for production",
+    "Implement automated dependency updates and security scanning",
+    
+    # Security tasks
+    "Perform security audit and implement recommended fixes",
+    "Add input validation and sanitization for all user-facing inputs",
+    "Implement proper authentication and authorization mechanisms",
+    
+    # Performance tasks
+    "Add performance monitoring and alerting for production systems",
+    "Implement caching strategies for frequently accessed data",
+    "Optimize database queries and add proper indexing",
+    
+    # Code quality tasks
+    "Set up code formatting and linting with automatic fixes",
+    "Refactor duplicate code and improve overall maintainability",
+    "Add error handling and logging throughout the application",
+    
+    # Infrastructure tasks
+    "Create production deployment configuration with proper scaling",
+    "Add monitoring and observability with metrics and dashboards",
+    "Implement backup and disaster recovery procedures",
+)
 
 
 def analyze_and_suggest_tasks(repo_path: str):
     """Analyze a repository and suggest appropriate tasks."""
+    from repo_analyzer import RepoAnalyzer
     
     analyzer = RepoAnalyzer(Path(repo_path))
     analyzer._scan_files()
     analyzer._analyze_languages()
     
+    # Framework names seen in file paths, collected during the scan itself
+    found = analyzer.framework_hints
+    
     tasks = []
     
     # Python-specific suggestions
@@ -35,7 +72,7 @@ def analyze_and_suggest_tasks(repo_path: str):
         ])
         
         # Django-specific
-        if any('django' in str(f).lower() for files in analyzer.files_by_extension.values() for f in files):
+        if 'django' in found:
             tasks.append("Add Django REST API endpoints with proper serializers and viewsets")
     
     # JavaScript/TypeScript suggestions
@@ -47,7 +84,7 @@ def analyze_and_suggest_tasks(repo_path: str):
         ])
         
         # React-specific
-        if any('react' in str(f).lower() for files in analyzer.files_by_extension.values() for f in files):
+        if 'react' in found:
             tasks.append("Add React Testing Library tests for all components")
     
     # Java suggestions
@@ -88,6 +125,9 @@ def analyze_and_suggest_tasks(repo_path: str):
 
 def run_multi_language_workflow(repo_path: str):
     """Run a comprehensive workflow for a multi-language project."""
+    # Imported lazily so the orchestrator's LLM stack only loads when used
+    from orchestrator_standalone import StandaloneOrchestrator
+    from src.agents.env_interaction.command_executor import LocalExecutor
     
     print(f"🔍 Analyzing repository: {repo_path}")
     print("=" * 60)
@@ -95,22 +135,27 @@ def run_multi_language_workflow(repo_path: str):
     # Analyze the repository
     tasks, analyzer = analyze_and_suggest_tasks(repo_path)
     
-    # Show analysis results
-    print("📊 Repository Analysis:")
-    print(f"  Total files: {analyzer.total_files}")
-    print(f"  Programming languages:")
+    # Show analysis results, emitted with a single write
+    summary = [
+        "📊 Repository Analysis:",
+        f"  Total files: {analyzer.total_files}",
+        f"  Programming languages:",
+    ]
+    total_lines = sum(analyzer.languages.values())
     for lang, lines in analyzer.languages.most_common(5):
-        percentage = (lines / sum(analyzer.languages.values())) * 100
-        print(f"    • {lang}: {lines:,} lines ({percentage:.1f}%)")
+        percentage = (lines / total_lines) * 100
+        summary.append(f"    • {lang}: {lines:,} lines ({percentage:.1f}%)")
     
     complexity, desc = analyzer.get_complexity_score()
-    print(f"  Complexity: {complexity} ({desc})")
+    summary.append(f"  Complexity: {complexity} ({desc})")
     
-    print(f"\n💡 Suggested Tasks ({len(tasks)} total):")
-    for i, task in enumerate(tasks[:8], 1):
-        print(f"  {i}. {task}")
+    summary.append(f"\n💡 Suggested Tasks ({len(tasks)} total):")
+    summary.extend(f"  {i}. {task}" for i, task in enumerate(itertools.islice(tasks, 8), 1))
     if len(tasks) > 8:
-        print(f"     ... and {len(tasks) - 8} more")
+        summary.append(f"     ... and {len(tasks) - 8} more")
+    
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
     
     # Create orchestrator
     executor = LocalExecutor(working_directory=repo_path)
@@ -138,43 +183,7 @@ def run_multi_language_workflow(repo_path: str):
 
 def example_cross_platform_tasks():
     """Tasks that work well across different platforms and languages."""
-    
-    return [
-        # Documentation tasks
-        "Create comprehensive API documentation with examples and usage patterns",
-        "Add inline code documentation following language-specific conventions",
-        "Generate project documentation website with proper navigation and search",
-        
-        # Testing tasks
-        "Add comprehensive test suite with unit, integration, and end-to-end tests",
-        "Implement test data factories and fixtures for consistent testing",
-        "Add performance and load testing for critical application paths",
-        
-        # CI/CD tasks
-        "Set up GitHub Actions workflow with testing, linting, and deployment stages",
-        "Add Docker containerization with multi-stage builds for production",
-        "Implement automated dependency updates and security scanning",
-        
-        # Security tasks
-        "Perform security audit and implement recommended fixes",
-        "Add input validation and sanitization for all user-facing inputs",
-        "Implement proper authentication and authorization mechanisms",
-        
-        # Performance tasks
-        "Add performance monitoring and alerting for production systems",
-        "Implement caching strategies for frequently accessed data",
-        "Optimize database queries and add proper indexing",
-        
-        # Code quality tasks
-        "Set up code formatting and linting with automatic fixes",
-        "Refactor duplicate code and improve overall maintainability",
-        "Add error handling and logging throughout the application",
-        
-        # Infrastructure tasks
-        "Create production deployment configuration with proper scaling",
-        "Add monitoring and observability with metrics and dashboards",
-        "Implement backup and disaster recovery procedures",
-    ]
+    return _CROSS_PLATFORM_TASKS
 
 
 def main():
@@ -190,7 +199,7 @@ def main():
     # Show cross-platform tasks
     cross_platform_tasks = example_cross_platform_tasks()
     print(f"\n🔧 Cross-Platform Tasks ({len(cross_platform_tasks)} examples):")
-    for i, task in enumerate(cross_platform_tasks[:6], 1):
+    for i, task in enumerate(itertools.islice(cross_platform_tasks, 6), 1):
         print(f"  {i}. {task}")
     print(f"     ... and {len(cross_platform_tasks) - 6} more")
     
@@ -54,6 +54,12 @@ for package in "${REQUIRED_PACKAGES[@]}"; do
     $PIP_CMD install "$package" --user
 done
 
+# Install the orchestrator modules themselves so the CLI, demo and examples
+# can import them from any directory. Dependencies were handled above, and
+# terminal-bench is only needed for evaluation, so skip pip's resolution.
+echo "Installing the orchestrator (editable)..."
+$PIP_CMD install --user --no-deps --ignore-requires-python -e .
+
 echo "✅ All packages installed successfully!"
 
 # Check if git is available (optional)
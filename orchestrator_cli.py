@@ -21,9 +21,36 @@ from typing import Optional
 # Add src to path so we can import the orchestrator
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
-from src.agents.env_interaction.command_executor import LocalExecutor
 from orchestrator_config import OrchestratorConfig
-from orchestrator_standalone import StandaloneOrchestrator
+
+# Entries that mark a directory as a code repository in validate_directory
+_CODE_SUFFIXES = frozenset({
+    ".py", ".js", ".ts", ".java", ".cpp", ".c", ".h",
+    ".go", ".rs", ".rb", ".php", ".cs", ".swift"
+})
+_CODE_FILENAMES = frozenset({
+    "package.json", "requirements.txt", "Cargo.toml", "pom.xml",
+    "Makefile", "CMakeLists.txt", ".git"
+})
+
+
+_VCS_DIRS = (".git", ".hg", ".svn")
+
+_MISSING_KEY_HELP = (
+    "❌ Error: No API key found!",
+    "Please set one of these environment variables:",
+    "  - LITELLM_API_KEY",
+    "  - LITE_LLM_API_KEY",
+    "",
+    "Or provide it via --api-key argument",
+    "",
+    "Example:",
+    "  export LITELLM_API_KEY='your-api-key-here'",
+)
+
+
+def _is_code_entry(name: str) -> bool:
+    return name in _CODE_FILENAMES or os.path.splitext(name)[1] in _CODE_SUFFIXES
 
 
 def setup_logging(verbose: bool = False):
@@ -36,22 +63,6 @@ def setup_logging(verbose: bool = False):
     )
 
 
-def validate_environment():
-    """Validate that required environment variables are set."""
-    api_key = os.getenv("LITELLM_API_KEY") or os.getenv("LITE_LLM_API_KEY")
-    if not api_key:
-        print("❌ Error: No API key found!")
-        print("Please set one of these environment variables:")
-        print("  - LITELLM_API_KEY")
-        print("  - LITE_LLM_API_KEY")
-        print()
-        print("Example:")
-        print("  export LITELLM_API_KEY='your-api-key-here'")
-        return False
-    
-    return True
-
-
 def validate_directory(directory: Path) -> bool:
     """Validate that the target directory exists and looks like a code repository."""
     if not directory.exists():
@@ -62,19 +73,20 @@ def validate_directory(directory: Path) -> bool:
         print(f"❌ Error: '{directory}' is not a directory.")
         return False
     
-    # Check if it looks like a code repository (has common code files)
-    code_indicators = [
-        "*.py", "*.js", "*.ts", "*.java", "*.cpp", "*.c", "*.h", 
-        "*.go", "*.rs", "*.rb", "*.php", "*.cs", "*.swift",
-        "package.json", "requirements.txt", "Cargo.toml", "pom.xml",
-        "Makefile", "CMakeLists.txt", ".git"
-    ]
+    # A version-controlled checkout is taken as a code repository outright
+    if any((directory / vcs_dir).exists() for vcs_dir in _VCS_DIRS):
+        return True
+    
+    # Check if it looks like a code repository (has common code files).
+    # The top level almost always decides it; only walk deeper if it doesn't
+    with os.scandir(directory) as entries:
+        has_code = any(_is_code_entry(entry.name) for entry in entries)
     
-    has_code = False
-    for indicator in code_indicators:
-        if list(directory.glob(indicator)) or list(directory.rglob(indicator)):
-            has_code = True
-            break
+    if not has_code:
+        for _, dirs, files in os.walk(directory):
+            if any(_is_code_entry(name) for name in dirs) or any(_is_code_entry(name) for name in files):
+                has_code = True
+                break
     
     if not has_code:
         print(f"⚠️  Warning: Directory '{directory}' doesn't appear to contain code files.")
@@ -195,16 +207,8 @@ Environment Variables:
     )
     
     # Validate that we have an API key
-    if not effective_config.get("api_key"):
-        print("❌ Error: No API key found!")
-        print("Please set one of these environment variables:")
-        print("  - LITELLM_API_KEY")
-        print("  - LITE_LLM_API_KEY")
-        print()
-        print("Or provide it via --api-key argument")
-        print()
-        print("Example:")
-        print("  export LITELLM_API_KEY='your-api-key-here'")
+    if effective_config.missing_api_key:
+        print("\n".join(_MISSING_KEY_HELP))
         sys.exit(1)
     
     # Validate directory
@@ -212,18 +216,27 @@ Environment Variables:
     if not validate_directory(target_directory):
         sys.exit(1)
     
-    print("🤖 Orchestrator Multi-Agent Coding System")
-    print("=" * 50)
-    print(f"📁 Working directory: {target_directory}")
-    print(f"🎯 Task: {args.task}")
-    print(f"🧠 Model: {effective_config['model']}")
-    print(f"🌡️  Temperature: {effective_config['temperature']}")
-    print(f"🔄 Max turns: {effective_config['max_turns']}")
+    banner = [
+        "🤖 Orchestrator Multi-Agent Coding System",
+        "=" * 50,
+        f"📁 Working directory: {target_directory}",
+        f"🎯 Task: {args.task}",
+        f"🧠 Model: {effective_config['model']}",
+        f"🌡️  Temperature: {effective_config['temperature']}",
+        f"🔄 Max turns: {effective_config['max_turns']}",
+    ]
     if args.logging_dir:
-        print(f"📝 Logging to: {args.logging_dir}")
-    print("=" * 50)
+        banner.append(f"📝 Logging to: {args.logging_dir}")
+    banner.append("=" * 50)
+    sys.stdout.write("\n".join(banner) + "\n")
+    sys.stdout.flush()
     
     try:
+        # Imported here so --help, --show-config and argument errors don't pay
+        # for loading litellm and the rest of the orchestrator stack
+        from src.agents.env_interaction.command_executor import LocalExecutor
+        from orchestrator_standalone import StandaloneOrchestrator
+        
         # Create local command executor for the target directory
         executor = LocalExecutor(working_directory=str(target_directory))
         
@@ -264,16 +277,9 @@ Environment Variables:
             print(f"📝 Detailed logs saved to: {args.logging_dir}")
         
         # Show token usage if available
-        if hasattr(orchestrator, 'orchestrator_messages'):
+        if hasattr(orchestrator, 'count_tokens'):
             try:
-                from src.agents.utils.llm_client import count_input_tokens, count_output_tokens
-                
-                total_input_tokens = sum(count_input_tokens(msg['content'], effective_config["model"]) 
-                                       for msg in orchestrator.orchestrator_messages 
-                                       if msg['role'] in ['system', 'user'])
-                total_output_tokens = sum(count_output_tokens(msg['content'], effective_config["model"]) 
-                                        for msg in orchestrator.orchestrator_messages 
-                                        if msg['role'] == 'assistant')
+                total_input_tokens, total_output_tokens = orchestrator.count_tokens()
                 
                 print(f"🪙 Tokens used: {total_input_tokens} input + {total_output_tokens} output = {total_input_tokens + total_output_tokens} total")
             except Exception as e:
@@ -6,15 +6,131 @@ This module handles loading and saving configuration for the orchestrator,
 making it easier for users to set up their preferred models, API keys, etc.
 """
 
+import contextlib
+import copy
+from collections import namedtuple
+import functools
 import json
 import os
+import secrets
+import stat
+import sys
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is used otherwise
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+# Environment variables consulted by get_effective_config and show_config
+_ENV_VARS = (
+    "LITELLM_MODEL",
+    "LITELLM_TEMPERATURE",
+    "LITELLM_API_KEY",
+    "LITE_LLM_API_KEY",
+    "LITELLM_API_BASE",
+)
+_EnvSnapshot = namedtuple("_EnvSnapshot", [name.lower() for name in _ENV_VARS])
+_env_snapshot: Optional[_EnvSnapshot] = None
+
+
+def _get_env_snapshot() -> _EnvSnapshot:
+    """Return the orchestrator environment variables, read once per process."""
+    global _env_snapshot
+    if _env_snapshot is None:
+        _env_snapshot = _EnvSnapshot(*(os.getenv(name) for name in _ENV_VARS))
+    return _env_snapshot
+
+
+def refresh_env_snapshot() -> None:
+    """Drop the cached environment so the next lookup re-reads os.environ."""
+    global _env_snapshot
+    _env_snapshot = None
+
+
+@dataclass
+class EffectiveConfig:
+    """Resolved configuration returned by OrchestratorConfig.get_effective_config."""
+    values: Dict[str, Any]
+    missing_api_key: bool
+    
+    def __getitem__(self, key: str) -> Any:
+        return self.values[key]
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        return self.values.get(key, default)
+
+
+def _dumps_config(data: Dict[str, Any]) -> bytes:
+    """Serialize configuration as 2-space indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _load_config_cached(path: str, ino: int, mtime_ns: int, ctime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file, memoized on its path and stat identity.
+    
+    The inode changes on every _atomic_write, and ctime on any in-place
+    write, so a same-size rewrite within the mtime resolution still misses.
+    Callers must not mutate the returned dict.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf-8"))
+
+
+def _create_sibling_temp(path: Path) -> Tuple[int, str]:
+    """Exclusively create a uniquely named temp file next to path.
+    
+    Unlike mkstemp (always 0600), the file is opened with mode 0666 so the
+    kernel applies the process umask, exactly as open() would for a new file.
+    """
+    flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY | getattr(os, "O_BINARY", 0)
+    while True:
+        tmp_path = os.path.join(path.parent, f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(tmp_path, flags, 0o666), tmp_path
+        except FileExistsError:
+            continue
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write data to a sibling temp file and rename it over path.
+    
+    Readers (and the load cache) never observe a partially written file.
+    A symlinked path is resolved so the link's target is replaced rather
+    than the link itself. An existing file keeps its permission bits; a new
+    one gets the umask default, as open() would give it.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        mode: Optional[int] = stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        mode = None
+    
+    fd, tmp_path = _create_sibling_temp(path)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
+
 class OrchestratorConfig:
     """Manages configuration for the Orchestrator CLI."""
     
@@ -38,15 +154,20 @@ class OrchestratorConfig:
         
         self.config_file = config_file
         self._config = self.DEFAULT_CONFIG.copy()
+        self._effective_base: Optional[Dict[str, Any]] = None
+        self._effective_env: Optional[_EnvSnapshot] = None
         self.load()
     
     def load(self) -> None:
         """Load configuration from file."""
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    self._config.update(loaded_config)
+                st = os.stat(self.config_file)
+                loaded_config = _load_config_cached(
+                    str(self.config_file), st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size
+                )
+                self._config.update(copy.deepcopy(loaded_config))
+                self._effective_base = None
                 logger.debug(f"Loaded configuration from {self.config_file}")
             except Exception as e:
                 logger.warning(f"Failed to load configuration from {self.config_file}: {e}")
@@ -58,8 +179,7 @@ class OrchestratorConfig:
             # Create directory if it doesn't exist
             self.config_file.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w') as f:
-                json.dump(self._config, f, indent=2)
+            _atomic_write(self.config_file, _dumps_config(self._config))
             logger.debug(f"Saved configuration to {self.config_file}")
         except Exception as e:
             logger.error(f"Failed to save configuration to {self.config_file}: {e}")
@@ -71,13 +191,45 @@ class OrchestratorConfig:
     def set(self, key: str, value: Any) -> None:
         """Set configuration value."""
         self._config[key] = value
+        self._effective_base = None
+    
+    def _get_effective_base(self) -> Dict[str, Any]:
+        """Return config file values with environment overrides applied.
+        
+        Rebuilt only after set()/load() or when the environment snapshot is refreshed.
+        """
+        env = _get_env_snapshot()
+        if self._effective_base is not None and self._effective_env is env:
+            return self._effective_base
+        
+        config = self._config.copy()
+        
+        # Override with environment variables
+        if env.litellm_model:
+            config["model"] = env.litellm_model
+        
+        if env.litellm_temperature:
+            try:
+                config["temperature"] = float(env.litellm_temperature)
+            except ValueError:
+                logger.warning(f"Invalid LITELLM_TEMPERATURE value: {env.litellm_temperature}")
+        
+        if env.litellm_api_base:
+            config["api_base"] = env.litellm_api_base
+        
+        # Get API key from environment (required)
+        config["api_key"] = env.litellm_api_key or env.lite_llm_api_key
+        
+        self._effective_base = config
+        self._effective_env = env
+        return config
     
     def get_effective_config(self, 
                            model: Optional[str] = None,
                            temperature: Optional[float] = None,
                            api_key: Optional[str] = None,
                            api_base: Optional[str] = None,
-                           max_turns: Optional[int] = None) -> Dict[str, Any]:
+                           max_turns: Optional[int] = None) -> EffectiveConfig:
         """Get effective configuration, combining config file, environment variables, and CLI overrides.
         
         Args:
@@ -88,30 +240,10 @@ class OrchestratorConfig:
             max_turns: CLI override for max turns
             
         Returns:
-            Dictionary with effective configuration
+            EffectiveConfig with the merged values and whether an API key is missing
         """
-        # Start with config file values
-        config = self._config.copy()
-        
-        # Override with environment variables
-        env_model = os.getenv("LITELLM_MODEL")
-        if env_model:
-            config["model"] = env_model
-        
-        env_temperature = os.getenv("LITELLM_TEMPERATURE")
-        if env_temperature:
-            try:
-                config["temperature"] = float(env_temperature)
-            except ValueError:
-                logger.warning(f"Invalid LITELLM_TEMPERATURE value: {env_temperature}")
-        
-        env_api_base = os.getenv("LITELLM_API_BASE")
-        if env_api_base:
-            config["api_base"] = env_api_base
-        
-        # Get API key from environment (required)
-        env_api_key = os.getenv("LITELLM_API_KEY") or os.getenv("LITE_LLM_API_KEY")
-        config["api_key"] = env_api_key
+        # Start with config file values plus environment overrides
+        config = self._get_effective_base().copy()
         
         # Override with CLI arguments
         if model is not None:
@@ -125,40 +257,33 @@ class OrchestratorConfig:
         if max_turns is not None:
             config["max_turns"] = max_turns
         
-        return config
+        return EffectiveConfig(values=config, missing_api_key=not config["api_key"])
     
     def show_config(self) -> None:
         """Print current configuration."""
-        print("📋 Current Configuration:")
-        print("-" * 30)
+        lines = ["📋 Current Configuration:", "-" * 30]
         for key, value in self._config.items():
             if key == "api_key":
                 # Don't show the full API key for security
-                display_value = f"{value[:8]}..." if value else "Not set"
+                display_value = value[:8] + "..." if value else "Not set"
             else:
                 display_value = value
-            print(f"  {key}: {display_value}")
-        print(f"\n📁 Config file: {self.config_file}")
+            lines.append(f"  {key}: {display_value}")
+        lines.append(f"\n📁 Config file: {self.config_file}")
         
         # Show environment variables
-        print("\n🌍 Environment Variables:")
-        env_vars = {
-            "LITELLM_MODEL": os.getenv("LITELLM_MODEL"),
-            "LITELLM_TEMPERATURE": os.getenv("LITELLM_TEMPERATURE"), 
-            "LITELLM_API_KEY": os.getenv("LITELLM_API_KEY"),
-            "LITE_LLM_API_KEY": os.getenv("LITE_LLM_API_KEY"),
-            "LITELLM_API_BASE": os.getenv("LITELLM_API_BASE")
-        }
-        
-        for key, value in env_vars.items():
-            if value:
-                if "API_KEY" in key:
-                    display_value = f"{value[:8]}..." if len(value) > 8 else "***"
-                else:
-                    display_value = value
-                print(f"  {key}: {display_value}")
+        lines.append("\n🌍 Environment Variables:")
+        for key, value in zip(_ENV_VARS, _get_env_snapshot()):
+            if not value:
+                display_value = "Not set"
+            elif "API_KEY" in key:
+                display_value = value[:8] + "..." if len(value) > 8 else "***"
             else:
-                print(f"  {key}: Not set")
+                display_value = value
+            lines.append(f"  {key}: {display_value}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
 
 def create_sample_config():
@@ -190,8 +315,7 @@ def create_sample_config():
     config.config_file.parent.mkdir(parents=True, exist_ok=True)
     
     try:
-        with open(config.config_file, 'w') as f:
-            json.dump(sample_config_with_comments, f, indent=2)
+        _atomic_write(config.config_file, _dumps_config(sample_config_with_comments))
         print(f"✅ Created sample configuration file: {config.config_file}")
         print("Edit this file to customize your default settings.")
     except Exception as e:
@@ -6,11 +6,17 @@ This is a simplified version of the OrchestratorAgent that removes the TerminalB
 coupling, making it usable on any repository.
 """
 
+import functools
+import io
 import json
 import logging
+import queue
+import threading
 import time
+from collections import deque
+from itertools import islice
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent / "src"))
@@ -19,13 +25,15 @@ from src.agents.actions.orchestrator_hub import OrchestratorHub
 from src.agents.actions.parsing.action_handler import ActionHandler
 from src.agents.actions.state_managers import ScratchpadManager, TodoManager
 from src.agents.env_interaction.entities.conversation_history import ConversationHistory
+from src.agents.env_interaction.entities.execution_result import ExecutionResult
 from src.agents.env_interaction.entities.turn import Turn
 from src.agents.env_interaction.turn_executor import TurnExecutor
-from src.agents.actions.parsing.parser import SimpleActionParser
+from src.agents.actions.parsing.parser import FinishBlockDetector, SimpleActionParser
 
 from src.agents.utils.llm_client import (
     count_input_tokens,
     count_output_tokens,
+    count_tokens_for_messages,
     get_llm_response,
 )
 
@@ -38,6 +46,44 @@ from src.agents.system_msgs.system_msg_loader import load_orchestrator_system_me
 logger = logging.getLogger(__name__)
 setup_file_logging("INFO")
 
+@functools.lru_cache(maxsize=8)
+def _load_sys_msg(path: Optional[str]) -> str:
+    """Read a system message once per process (the default one when path is None)."""
+    if path:
+        # If explicit path provided, load from that file
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    # Use default system message loader
+    return load_orchestrator_system_message()
+
+
+@functools.lru_cache(maxsize=8)
+def _sys_msg_tokens(sys_msg: str, model: Optional[str]) -> int:
+    """Token count of a system message, computed once per (message, model)."""
+    return count_input_tokens([{"role": "system", "content": sys_msg}], model)
+
+
+# Requests replay recent turns as chat messages after a fixed opening message:
+#   user:      task (+ rolling summary)
+#   assistant: turn output          user: that turn's results     (per replayed turn)
+# The newest user message additionally carries the current hub state, which is
+# therefore sent once per request instead of once per replayed turn.
+_TASK_TEMPLATE = "## Current Task\n{instruction}"
+_SUMMARY_TEMPLATE = "\n\n## Summary of Earlier Turns\n{summary}"
+_RESULTS_TEMPLATE = "## Turn {turn_number} Results\n{env_output}"
+_USER_TEMPLATE = (
+    "{last_turn_results}"
+    "{state}\n\n"
+    "What action would you like to take next?"
+)
+
+_SUMMARY_SYSTEM_MESSAGE = (
+    "You maintain a running memory for a coding orchestrator. Merge the existing "
+    "summary with the new turns into a concise list of atomic facts: decisions made, "
+    "tasks delegated and their outcomes, files and findings discovered, and open "
+    "problems. Drop anything superseded. Reply with the bullet list only."
+)
+
 
 class StandaloneOrchestrator:
     """Standalone orchestrator agent for use on any repository."""
@@ -76,23 +122,86 @@ class StandaloneOrchestrator:
         self.action_parser = None
         self.action_handler = None
         self.executor = None
+        self.turn_executor = None
         self.state = None
         
-        # Track orchestrator's messages for token counting
-        self.orchestrator_messages = []
+        # Only the last history_window_k..history_window_k + summary_interval - 1 turns
+        # are replayed verbatim; older turns are folded into rolling_summary, which is
+        # refreshed every summary_interval turns so the prefix stays stable in between
+        self.history_window_k = 6
+        self.summary_interval = 5
+        self.rolling_summary = ""
+        self._reset_turn_tracking()
+        
+        # Tokens sent and received across every request of the run, summary calls included
+        self._input_token_total = 0
+        self._output_token_total = 0
         
         # Turn logger (will be initialized in perform_task)
         self.turn_logger = None
         self.logging_dir = None
+        
+        # Turn logs are written by a background thread so disk I/O stays off the turn loop;
+        # it is started by the first queued turn and stopped by close_logs()
+        self._log_queue: Optional[queue.Queue] = None
+        self._log_thread: Optional[threading.Thread] = None
     
     def _load_system_message(self, path: Optional[str]) -> str:
-        if path:
-            # If explicit path provided, load from that file
-            with open(path, 'r', encoding='utf-8') as f:
-                return f.read()
+        return _load_sys_msg(path)
+    
+    def _reset_turn_tracking(self) -> None:
+        # Turns are numbered by _turn_count alone, independent of how many turns
+        # ConversationHistory keeps. A turn stays in _unsummarized, and is replayed,
+        # until it has been folded into rolling_summary.
+        self._turn_count = 0
+        self._summarized_turns = 0
+        self._unsummarized: deque = deque()
+    
+    def count_tokens(self) -> Tuple[int, int]:
+        """Return (input_tokens, output_tokens) for the orchestrator's own requests."""
+        return self._input_token_total, self._output_token_total
+    
+    def _record_usage(self, messages: List[Dict[str, Any]], response: str,
+                      usage: Optional[Tuple[int, int]]) -> None:
+        """Add one request's tokens to the running totals.
+        
+        usage is what the provider reported, if anything. Otherwise the whole
+        request is counted: the system message (memoized), every replayed message
+        of either role, and the response.
+        """
+        if usage is not None:
+            input_tokens, output_tokens = usage
         else:
-            # Use default system message loader
-            return load_orchestrator_system_message()
+            input_tokens = count_tokens_for_messages(messages[1:], self.model)
+            if messages[0]["role"] == "system":
+                input_tokens += _sys_msg_tokens(messages[0]["content"], self.model)
+            else:
+                input_tokens += count_tokens_for_messages(messages[:1], self.model)
+            output_tokens = count_output_tokens([{"role": "assistant", "content": response}], self.model)
+        self._input_token_total += input_tokens
+        self._output_token_total += output_tokens
+    
+    def _llm_call(self, messages: List[Dict[str, Any]],
+                  **kwargs) -> Tuple[Any, List[Optional[Tuple[int, int]]]]:
+        """Call get_llm_response, returning its result and a usage holder.
+        
+        The holder is a one-element list set to the last (prompt, completion)
+        usage the provider reported; it may only be filled once a stream is read.
+        """
+        usage: List[Optional[Tuple[int, int]]] = [None]
+        
+        def on_usage(prompt_tokens: int, completion_tokens: int) -> None:
+            usage[0] = (prompt_tokens, completion_tokens)
+        
+        result = get_llm_response(
+            messages=messages,
+            model=self.model,
+            api_key=self.api_key,
+            api_base=self.api_base,
+            on_usage=on_usage,
+            **kwargs
+        )
+        return result, usage
     
     def setup(self, command_executor: CommandExecutor, logging_dir: Optional[Path] = None):
         """Setup the orchestrator with the necessary components.
@@ -125,14 +234,68 @@ class StandaloneOrchestrator:
         
         # Store executor
         self.executor = command_executor
+        self.turn_executor = TurnExecutor(
+            action_parser=self.action_parser,
+            action_handler=self.action_handler,
+        )
         
         # Initialize state
-        self.state = OrchestratorState()
+        self.state = OrchestratorState(
+            orchestrator_hub=self.orchestrator_hub,
+            conversation_history=self.conversation_history
+        )
+        self.rolling_summary = ""
+        self._reset_turn_tracking()
+        self._input_token_total = 0
+        self._output_token_total = 0
         
         # Initialize turn logger if logging directory provided
+        self.close_logs()
         if logging_dir:
             self.turn_logger = TurnLogger(logging_dir, "orchestrator")
     
+    def _start_log_writer(self) -> None:
+        self._log_queue = queue.Queue()
+        self._log_thread = threading.Thread(
+            target=self._log_drain, name="orchestrator-turn-log", daemon=True
+        )
+        self._log_thread.start()
+    
+    def _log_drain(self) -> None:
+        """Write queued turns in order; runs on the log writer thread."""
+        while True:
+            item = self._log_queue.get()
+            if item is None:
+                # Sentinel from close_logs(); everything queued before it is written
+                self._log_queue.task_done()
+                return
+            turn_num, turn_data = item
+            try:
+                # Deferred from the turn loop: stringify actions only when writing
+                turn_data["actions_executed"] = [str(action) for action in turn_data["actions_executed"]]
+                self.turn_logger.log_turn(turn_num, turn_data)
+            except Exception as e:
+                logger.error(f"Failed to log turn {turn_num}: {e}")
+            finally:
+                self._log_queue.task_done()
+    
+    def flush_logs(self) -> None:
+        """Block until every queued turn log has been written."""
+        if self._log_queue is not None:
+            self._log_queue.join()
+    
+    def close_logs(self) -> None:
+        """Write every queued turn log and stop the log writer thread.
+        
+        A later turn starts a new writer, so this is safe to call between runs.
+        """
+        if self._log_thread is None:
+            return
+        self._log_queue.put(None)
+        self._log_thread.join()
+        self._log_queue = None
+        self._log_thread = None
+    
     def execute_turn(self, instruction: str, turn_num: int) -> Dict[str, Any]:
         """Execute a single orchestrator turn.
         
@@ -143,42 +306,19 @@ class StandaloneOrchestrator:
         Returns:
             Dictionary with turn results
         """
-        # Build user message with context
-        conversation_context = self.conversation_history.to_string()
-        state_context = self.state.to_string()
-        
-        user_message = f"""
-MAIN TASK: {instruction}
-
-CONVERSATION HISTORY:
-{conversation_context}
-
-CURRENT STATE:
-{state_context}
-
-What action would you like to take next?
-"""
+        # Recent turns are replayed as their own messages, so the new user message
+        # only carries what the last turn's actions returned and the current state
+        user_message = self._build_user_message()
         
         # Get LLM response
-        llm_response = self._get_llm_response(user_message)
-        
-        # Execute turn
-        turn_executor = TurnExecutor(
-            action_parser=self.action_parser,
-            action_handler=self.action_handler
-        )
+        llm_response = self._get_llm_response(self._request_messages(instruction, user_message))
         
-        result = turn_executor.execute_turn(
-            user_message=user_message,
-            llm_response=llm_response,
-            state=self.state
-        )
+        # Execute actions from LLM response
+        result = self.turn_executor.execute(llm_response)
         
         # Create turn object
         turn = Turn(
-            turn_number=turn_num,
-            user_message=user_message,
-            llm_response=llm_response,
+            llm_output=llm_response,
             actions_executed=result.actions_executed,
             env_responses=result.env_responses,
             subagent_trajectories=result.subagent_trajectories
@@ -186,22 +326,15 @@ What action would you like to take next?
         
         # Add to conversation history
         self.conversation_history.add_turn(turn)
+        self._turn_count += 1
+        self._unsummarized.append((self._turn_count, turn))
         
-        # Log this turn if logger is available
+        # Log this turn if logger is available; a logging failure must not abort the turn
         if self.turn_logger:
-            turn_data = {
-                "instruction": instruction,
-                "user_message": user_message,
-                "llm_response": llm_response,
-                "actions_executed": [str(action) for action in result.actions_executed],
-                "env_responses": result.env_responses,
-                "subagent_trajectories": result.subagent_trajectories,
-                "done": result.done,
-                "finish_message": result.finish_message,
-                "has_error": result.has_error,
-                "state_snapshot": self.state.to_dict()
-            }
-            self.turn_logger.log_turn(turn_num, turn_data)
+            try:
+                self._queue_turn_log(turn_num, instruction, user_message, llm_response, result)
+            except Exception as e:
+                logger.error(f"Failed to log turn {turn_num}: {e}")
         
         # Update done state
         if result.done:
@@ -219,32 +352,146 @@ What action would you like to take next?
             'turn': turn
         }
     
-    def _get_llm_response(self, user_message: str) -> str:
-        # Build messages for this request
+    def _queue_turn_log(self, turn_num: int, instruction: str, user_message: str,
+                        llm_response: str, result: ExecutionResult) -> None:
+        """Hand a turn's log record to the log writer thread."""
+        turn_data = {
+            "instruction": instruction,
+            "user_message": user_message,
+            "llm_response": llm_response,
+            "actions_executed": list(result.actions_executed),
+            "env_responses": result.env_responses,
+            "subagent_trajectories": result.subagent_trajectories,
+            "done": result.done,
+            "finish_message": result.finish_message,
+            "has_error": result.has_error,
+            # Snapshot now; the hub and history keep changing after this turn
+            "state_snapshot": self.state.to_dict()
+        }
+        if self._log_thread is None:
+            self._start_log_writer()
+        self._log_queue.put((turn_num, turn_data))
+    
+    def _build_user_message(self) -> str:
+        """Build the newest user message: the last turn's results plus the current state."""
+        last_turn_results = ""
+        if self._turn_count:
+            last_turn_results = self._render_results(
+                self._turn_count, self.conversation_history.turns[-1]
+            ) + "\n\n"
+        
+        return _USER_TEMPLATE.format_map({
+            "last_turn_results": last_turn_results,
+            "state": self.state.to_prompt(include_history=False),
+        })
+    
+    @staticmethod
+    def _render_results(turn_number: int, turn: Turn) -> str:
+        env_output = "\n".join(f"Env: {response}" for response in turn.env_responses)
+        return _RESULTS_TEMPLATE.format(turn_number=turn_number, env_output=env_output or "No output.")
+    
+    def _get_llm_response(self, messages: List[Dict[str, Any]]) -> str:
+        # get_llm_response marks the system message and the latest user messages
+        # as Anthropic cache breakpoints
+        request = dict(temperature=self.temperature, max_tokens=4096)
+        chunks, usage = self._llm_call(messages, stream=True, **request)
+        try:
+            response = self._consume_stream(chunks)
+        except Exception as e:
+            # get_llm_response only retries opening a stream. An overload or dropped
+            # connection mid-stream falls back to one non-streamed request, which
+            # gets the usual retry and backoff.
+            logger.warning(f"Response stream failed, retrying without streaming: {e}")
+            self._record_usage(messages, "", None)
+            response, usage = self._llm_call(messages, **request)
+        
+        self._record_usage(messages, response, usage[0])
+        return response
+    
+    @staticmethod
+    def _consume_stream(chunks) -> str:
+        """Accumulate streamed text, closing the stream early after a finish action.
+        
+        Nothing after a top-level finish block is executed, so the rest isn't needed.
+        """
+        buffer = io.StringIO()
+        detector = FinishBlockDetector()
+        try:
+            for chunk in chunks:
+                buffer.write(chunk)
+                if detector.feed(chunk):
+                    logger.debug("Finish action received; closing response stream early")
+                    break
+        finally:
+            chunks.close()
+        return buffer.getvalue()
+    
+    def _request_messages(self, instruction: str, user_message: str) -> List[Dict[str, Any]]:
+        """Build the messages for the next request, ending with user_message."""
+        self._maybe_refresh_summary()
+        
+        opening = _TASK_TEMPLATE.format(instruction=instruction)
+        if self.rolling_summary:
+            opening += _SUMMARY_TEMPLATE.format(summary=self.rolling_summary)
+        
+        window = self._window_turns()
+        if not window:
+            return [
+                {"role": "system", "content": self.system_message},
+                {"role": "user", "content": f"{opening}\n\n{user_message}"},
+            ]
+        
+        # Replayed turns are rendered the same way every time, so consecutive requests
+        # share their prefix up to the newest user message
         messages = [
             {"role": "system", "content": self.system_message},
-            {"role": "user", "content": user_message}
+            {"role": "user", "content": opening},
         ]
+        for turn_number, turn in window[:-1]:
+            messages.append({"role": "assistant", "content": turn.truncated_output()})
+            messages.append({"role": "user", "content": self._render_results(turn_number, turn)})
+        messages.append({"role": "assistant", "content": window[-1][1].truncated_output()})
+        messages.append({"role": "user", "content": user_message})
+        return messages
+    
+    def _window_turns(self) -> List[Tuple[int, Turn]]:
+        """(turn number, turn) of every turn not yet folded into the rolling summary."""
+        return list(self._unsummarized)
+    
+    def _maybe_refresh_summary(self) -> None:
+        """Fold turns that fell out of the verbatim window into the rolling summary."""
+        unsummarized = len(self._unsummarized)
+        if unsummarized < self.history_window_k + self.summary_interval:
+            return
         
-        # Track messages for token counting (add system message only once)
-        if not self.orchestrator_messages:
-            self.orchestrator_messages.append({"role": "system", "content": self.system_message})
-        self.orchestrator_messages.append({"role": "user", "content": user_message})
-        
-        # Call centralized LLM client
-        response = get_llm_response(
-            messages=messages,
-            model=self.model,
-            temperature=self.temperature,
-            max_tokens=4096,
-            api_key=self.api_key,
-            api_base=self.api_base
+        # Oldest turns not yet in the summary, leaving the last history_window_k verbatim
+        batch = list(islice(self._unsummarized, unsummarized - self.history_window_k))
+        turn_strs = [
+            f"--- Turn {turn_number} ---\n{turn.to_prompt()}"
+            for turn_number, turn in batch
+        ]
+        prompt = (
+            f"## Existing Summary\n{self.rolling_summary or 'None yet.'}\n\n"
+            f"## New Turns\n" + "\n\n".join(turn_strs)
         )
         
-        # Track assistant response
-        self.orchestrator_messages.append({"role": "assistant", "content": response})
+        messages = [
+            {"role": "system", "content": _SUMMARY_SYSTEM_MESSAGE},
+            {"role": "user", "content": prompt},
+        ]
+        try:
+            summary, usage = self._llm_call(messages, temperature=0.0, max_tokens=1024)
+            self._record_usage(messages, summary, usage[0])
+        except Exception as e:
+            # The turns stay unsummarized (and replayed); the next request retries
+            logger.warning(f"Failed to summarize conversation history: {e}")
+            return
         
-        return response
+        self.rolling_summary = summary.strip()
+        for _ in batch:
+            self._unsummarized.popleft()
+        self._summarized_turns = batch[-1][0]
+        logger.info(f"Summarized turns {batch[0][0]}-{self._summarized_turns} into rolling summary")
     
     def run(self, instruction: str, max_turns: int = 50) -> Dict[str, Any]:
         """Run the orchestrator until completion or max turns.
@@ -258,23 +505,27 @@ What action would you like to take next?
         """
         turns_executed = 0
         
-        while not self.state.done and turns_executed < max_turns:
-            turns_executed += 1
-            logger.info(f"Executing turn {turns_executed}")
-            logging.info(f"\n{'='*60}")
-            logging.info(f"ORCHESTRATOR MAIN LOOP - Turn {turns_executed}/{max_turns}")
-            logging.info(f"{'='*60}")
-            
-            try:
-                result = self.execute_turn(instruction, turns_executed)
+        try:
+            while not self.state.done and turns_executed < max_turns:
+                turns_executed += 1
+                logger.info(f"Executing turn {turns_executed}")
+                logging.info(f"\n{'='*60}")
+                logging.info(f"ORCHESTRATOR MAIN LOOP - Turn {turns_executed}/{max_turns}")
+                logging.info(f"{'='*60}")
                 
-                if result['done']:
-                    logger.info(f"Task completed: {result['finish_message']}")
-                    break
+                try:
+                    result = self.execute_turn(instruction, turns_executed)
                     
-            except Exception as e:
-                logger.error(f"Error in turn {turns_executed}: {e}")
-                # Could add error to conversation history here
+                    if result['done']:
+                        logger.info(f"Task completed: {result['finish_message']}")
+                        break
+                        
+                except Exception as e:
+                    logger.error(f"Error in turn {turns_executed}: {e}")
+                    # Could add error to conversation history here
+        finally:
+            # Make sure every turn is on disk, and the writer stopped, before returning
+            self.close_logs()
                 
         return {
             'completed': self.state.done,
@@ -9,13 +9,44 @@ This utility analyzes a repository to help users understand:
 """
 
 import argparse
+import fnmatch
 import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from collections import defaultdict, Counter
-from typing import Dict, List, Tuple
+from itertools import chain, islice
+from typing import Dict, Iterator, List, Optional, Tuple
 import re
 
 
+_READ_CHUNK_SIZE = 1 << 20
+
+
+def _count_lines(file_path) -> int:
+    """Count lines the way len(f.readlines()) would, without decoding the file.
+    
+    Counts newline bytes in 1 MiB chunks, plus one for a final unterminated line.
+    """
+    lines = 0
+    last_chunk = b''
+    with open(file_path, 'rb') as f:
+        while chunk := f.read(_READ_CHUNK_SIZE):
+            lines += chunk.count(b'\n')
+            last_chunk = chunk
+    if last_chunk and not last_chunk.endswith(b'\n'):
+        lines += 1
+    return lines
+
+
+def _count_lines_worker(file_path) -> Optional[int]:
+    """Process-pool entry point: line count, or None if the file can't be read."""
+    try:
+        return _count_lines(file_path)
+    except Exception:
+        return None
+
+
 class RepoAnalyzer:
     """Analyzes a repository to understand its structure and suggest tasks."""
     
@@ -60,6 +91,11 @@ class RepoAnalyzer:
         '.svelte': 'Svelte'
     }
     
+    # Languages as dense indices: suffix -> slot in _LANGS_BY_IDX / the per-scan count columns
+    _LANGS_BY_IDX = tuple(dict.fromkeys(LANGUAGE_EXTENSIONS.values()))
+    _SUFFIX_TO_LANGIDX = dict(zip(LANGUAGE_EXTENSIONS,
+                                  map(_LANGS_BY_IDX.index, LANGUAGE_EXTENSIONS.values())))
+    
     BUILD_FILES = {
         'package.json': 'Node.js/npm project',
         'yarn.lock': 'Yarn project',
@@ -84,6 +120,9 @@ class RepoAnalyzer:
         'vite.config.js': 'Vite project'
     }
     
+    # Build file names are matched case-insensitively
+    _BUILD_FILES_LOWER = {name.lower(): description for name, description in BUILD_FILES.items()}
+    
     IGNORE_DIRS = {
         '.git', '.svn', '.hg',
         'node_modules', '__pycache__', '.pytest_cache',
@@ -93,14 +132,108 @@ class RepoAnalyzer:
         'bin', 'obj', '.gradle'
     }
     
-    def __init__(self, repo_path: Path):
-        """Initialize analyzer with repository path."""
+    # Framework names recorded in framework_hints when they appear in a file path
+    FRAMEWORK_KEYWORDS = ('django', 'react', 'flask', 'vue', 'spring', 'rails')
+    
+    # Every keyword looked for in file paths, matched in one pass over the path blob
+    _PATH_KEYWORD_RE = re.compile('|'.join(map(re.escape, FRAMEWORK_KEYWORDS + ('fastapi',))))
+    
+    # Below this many code files, worker start-up costs more than it saves
+    PARALLEL_MIN_FILES = 200
+    
+    # Thread fallback size; reads and bytes.count release the GIL, so I/O overlaps
+    THREAD_WORKERS = 8
+    
+    # Bundles and lockfiles that would only skew the line counts; still listed as files
+    GENERATED_FILE_PATTERNS = (
+        '*.min.js', '*.min.css',
+        'package-lock.json', 'yarn.lock', 'poetry.lock', 'Cargo.lock'
+    )
+    _GENERATED_FILE_RE = re.compile(
+        '|'.join(fnmatch.translate(pattern.lower()) for pattern in GENERATED_FILE_PATTERNS)
+    )
+    
+    # Files larger than this are not line-counted
+    DEFAULT_MAX_SCAN_BYTES = 1 << 20
+    
+    PYTHON_SUGGESTIONS = (
+        "Add comprehensive unit tests for the core modules",
+        "Add type hints to improve code maintainability",
+        "Add error handling and logging throughout the codebase",
+        "Create API documentation using docstrings",
+        "Refactor large functions into smaller, more maintainable pieces"
+    )
+    
+    JAVASCRIPT_SUGGESTIONS = (
+        "Add Jest unit tests for the main components",
+        "Implement error boundaries for better error handling",
+        "Add ESLint configuration and fix linting issues",
+        "Optimize performance by implementing proper caching",
+        "Add comprehensive end-to-end tests"
+    )
+    
+    JAVA_SUGGESTIONS = (
+        "Add JUnit tests with proper test coverage",
+        "Implement proper exception handling patterns",
+        "Add comprehensive logging using SLF4J",
+        "Refactor to follow SOLID principles",
+        "Add integration tests for database operations"
+    )
+    
+    DJANGO_SUGGESTIONS = (
+        "Add Django Rest Framework API endpoints",
+        "Implement proper authentication and authorization",
+        "Add database migrations for new features",
+        "Create management commands for data processing"
+    )
+    
+    REACT_SUGGESTIONS = (
+        "Add React Testing Library tests for components",
+        "Implement proper state management with Redux/Zustand",
+        "Add accessibility improvements (ARIA labels, etc.)",
+        "Optimize bundle size and implement code splitting"
+    )
+    
+    GENERAL_SUGGESTIONS = (
+        "Add comprehensive README with setup instructions",
+        "Implement CI/CD pipeline with GitHub Actions",
+        "Add security audit and vulnerability fixes",
+        "Create development environment setup scripts",
+        "Add performance monitoring and metrics",
+        "Implement database schema migrations",
+        "Add API rate limiting and caching",
+        "Create user documentation and examples"
+    )
+    
+    def __init__(self, repo_path: Path, max_scan_bytes: int = DEFAULT_MAX_SCAN_BYTES,
+                 use_processes: bool = True):
+        """Initialize analyzer with repository path.
+        
+        Args:
+            repo_path: Repository to analyze
+            max_scan_bytes: Files larger than this are not line-counted
+            use_processes: Count lines of large repos in worker processes; when False
+                (or when processes can't be started) a thread pool is used instead
+        """
         self.repo_path = repo_path.resolve()
+        self.max_scan_bytes = max_scan_bytes
+        self.use_processes = use_processes
         self.files_by_extension = defaultdict(list)
-        self.languages = Counter()
+        # Lines per language index (see _LANGS_BY_IDX), plus which languages were seen;
+        # the languages property presents them as a Counter
+        self._lang_counts = array('q', bytes(8 * len(self._LANGS_BY_IDX)))
+        self._lang_seen = bytearray(len(self._LANGS_BY_IDX))
+        self._languages_cache: Optional[Counter] = None
         self.build_files = []
         self.total_files = 0
         self.total_lines = 0
+        self.framework_hints = set()
+        
+        # Path index built by _scan_files for framework/task detection
+        self._all_paths_lower: List[str] = []
+        self._basenames = set()
+        self._paths_blob = ''
+        self._path_hits = set()
         
     def analyze(self) -> None:
         """Perform full analysis of the repository."""
@@ -114,38 +247,124 @@ class RepoAnalyzer:
         
     def _scan_files(self) -> None:
         """Scan all files in the repository."""
-        for root, dirs, files in os.walk(self.repo_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if d not in self.IGNORE_DIRS]
+        # Code files and their languages, line-counted after the walk
+        code_files = []
+        code_langidx = []
+        prefix_len = len(os.path.join(str(self.repo_path), ''))
+        suffix_to_langidx = self._SUFFIX_TO_LANGIDX
+        
+        for entry in self._walk_files():
+            file = entry.name
             
-            root_path = Path(root)
-            for file in files:
-                file_path = root_path / file
-                relative_path = file_path.relative_to(self.repo_path)
-                
-                # Skip hidden files and common non-code files
-                if file.startswith('.') and file not in ['.gitignore', '.env.example']:
-                    continue
-                    
-                self.total_files += 1
-                
-                # Categorize by extension
-                suffix = file_path.suffix.lower()
-                self.files_by_extension[suffix].append(relative_path)
-                
-                # Count lines for code files
-                if suffix in self.LANGUAGE_EXTENSIONS:
-                    try:
-                        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                            lines = len(f.readlines())
-                            self.total_lines += lines
-                            self.languages[self.LANGUAGE_EXTENSIONS[suffix]] += lines
-                    except Exception:
-                        pass
+            # Skip hidden files and common non-code files
+            if file.startswith('.') and file not in ['.gitignore', '.env.example']:
+                continue
                 
-                # Check for build files
-                if file.lower() in [f.lower() for f in self.BUILD_FILES]:
-                    self.build_files.append((relative_path, self.BUILD_FILES.get(file, 'Unknown')))
+            self.total_files += 1
+            
+            # Relative paths are kept as plain strings
+            relative_path = entry.path[prefix_len:]
+            self._basenames.add(file)
+            
+            # Categorize by extension (same result as os.path.splitext: leading dots
+            # of dotfiles don't start an extension)
+            pre, dot, ext = file.rpartition('.')
+            suffix = '.' + ext.lower() if dot and pre.lstrip('.') else ''
+            self.files_by_extension[suffix].append(relative_path)
+            
+            # Count lines for code files, unless generated or too large to be hand-written
+            idx = suffix_to_langidx.get(suffix)
+            if idx is not None and self._should_count_lines(entry):
+                code_files.append(entry.path)
+                code_langidx.append(idx)
+            
+            # Check for build files
+            description = self._BUILD_FILES_LOWER.get(file.lower())
+            if description is not None:
+                self.build_files.append((relative_path, description))
+        
+        lang_counts = self._lang_counts
+        lang_seen = self._lang_seen
+        for idx, lines in zip(code_langidx, self._count_lines_all(code_files)):
+            if lines is not None:
+                self.total_lines += lines
+                lang_counts[idx] += lines
+                lang_seen[idx] = 1
+        self._languages_cache = None
+        
+        self._build_path_index()
+    
+    @property
+    def languages(self) -> Counter:
+        """Lines of code per language."""
+        if self._languages_cache is None:
+            self._languages_cache = Counter({
+                language: lines
+                for language, lines, seen in zip(self._LANGS_BY_IDX, self._lang_counts, self._lang_seen)
+                if seen
+            })
+        return self._languages_cache
+    
+    def _should_count_lines(self, entry: os.DirEntry) -> bool:
+        if self._GENERATED_FILE_RE.match(entry.name.lower()):
+            return False
+        try:
+            return entry.stat().st_size <= self.max_scan_bytes
+        except OSError:
+            return False
+    
+    def _build_path_index(self) -> None:
+        """Index scanned paths once so detection does substring/set checks, not rescans."""
+        self._all_paths_lower = [
+            path.lower() for paths in self.files_by_extension.values() for path in paths
+        ]
+        # Newline can't occur inside a keyword, so matches never span two paths
+        self._paths_blob = '\n'.join(self._all_paths_lower)
+        self._path_hits = set(self._PATH_KEYWORD_RE.findall(self._paths_blob))
+        self.framework_hints = self._path_hits.intersection(self.FRAMEWORK_KEYWORDS)
+    
+    def _walk_files(self):
+        """Yield a DirEntry for every non-directory file, skipping IGNORE_DIRS.
+        
+        Visits directories in the same top-down order as os.walk, and like os.walk
+        does not descend into symlinked directories or fail on unreadable ones.
+        """
+        stack = [str(self.repo_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if not is_dir:
+                    yield entry
+                elif entry.name not in self.IGNORE_DIRS and not entry.is_symlink():
+                    subdirs.append(entry.path)
+            stack.extend(reversed(subdirs))
+    
+    def _count_lines_all(self, paths: List[str]) -> List[Optional[int]]:
+        """Line-count paths in order, fanning out to a worker pool for large repos."""
+        if len(paths) < self.PARALLEL_MIN_FILES:
+            return [_count_lines_worker(path) for path in paths]
+        
+        if self.use_processes:
+            try:
+                with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+                    return list(pool.map(_count_lines_worker, paths, chunksize=64))
+            except (OSError, RuntimeError):
+                # No usable multiprocessing here (e.g. restricted sandbox); use threads
+                pass
+        
+        # Results are merged on the calling thread, so workers share no counters
+        with ThreadPoolExecutor(max_workers=self.THREAD_WORKERS) as pool:
+            return list(pool.map(_count_lines_worker, paths))
     
     def _analyze_languages(self) -> None:
         """Analyze programming languages used."""
@@ -181,15 +400,15 @@ class RepoAnalyzer:
         
         # Check for common Python frameworks
         if any('python' in lang.lower() for lang in self.languages):
-            if any(f.name == 'manage.py' for files in self.files_by_extension.values() for f in files):
+            if 'manage.py' in self._basenames:
                 frameworks.append("Django web framework")
-            if any('flask' in str(f).lower() for files in self.files_by_extension.values() for f in files):
+            if 'flask' in self._path_hits:
                 frameworks.append("Flask web framework")
-            if any('fastapi' in str(f).lower() for files in self.files_by_extension.values() for f in files):
+            if 'fastapi' in self._path_hits:
                 frameworks.append("FastAPI framework")
         
         # Check for JavaScript frameworks
-        if 'package.json' in [f.name for files in self.files_by_extension.values() for f in files]:
+        if 'package.json' in self._basenames:
             try:
                 package_json = self.repo_path / 'package.json'
                 if package_json.exists():
@@ -221,71 +440,33 @@ class RepoAnalyzer:
         print(f"\n💡 Suggested Tasks for Orchestrator:")
         print("-" * 40)
         
-        suggestions = []
+        # Only the first 10 suggestions are shown, so the pools are chained lazily
+        pools = list(self._suggestion_pools())
+        for i, suggestion in enumerate(islice(chain.from_iterable(pools), 10), 1):
+            print(f"  {i:2}. {suggestion}")
         
+        total = sum(map(len, pools))
+        if total > 10:
+            print(f"     ... and {total - 10} more possibilities!")
+    
+    def _suggestion_pools(self) -> Iterator[Tuple[str, ...]]:
+        """Yield the suggestion pools that apply to this repository, in display order."""
         # Language-specific suggestions
         if 'Python' in self.languages:
-            suggestions.extend([
-                "Add comprehensive unit tests for the core modules",
-                "Add type hints to improve code maintainability",
-                "Add error handling and logging throughout the codebase",
-                "Create API documentation using docstrings",
-                "Refactor large functions into smaller, more maintainable pieces"
-            ])
-        
+            yield self.PYTHON_SUGGESTIONS
         if any(lang in self.languages for lang in ['JavaScript', 'TypeScript']):
-            suggestions.extend([
-                "Add Jest unit tests for the main components",
-                "Implement error boundaries for better error handling", 
-                "Add ESLint configuration and fix linting issues",
-                "Optimize performance by implementing proper caching",
-                "Add comprehensive end-to-end tests"
-            ])
-        
+            yield self.JAVASCRIPT_SUGGESTIONS
         if 'Java' in self.languages:
-            suggestions.extend([
-                "Add JUnit tests with proper test coverage",
-                "Implement proper exception handling patterns",
-                "Add comprehensive logging using SLF4J",
-                "Refactor to follow SOLID principles",
-                "Add integration tests for database operations"
-            ])
-        
-        # Framework-specific suggestions  
-        if any('django' in str(f).lower() for files in self.files_by_extension.values() for f in files):
-            suggestions.extend([
-                "Add Django Rest Framework API endpoints",
-                "Implement proper authentication and authorization",
-                "Add database migrations for new features",
-                "Create management commands for data processing"
-            ])
+            yield self.JAVA_SUGGESTIONS
         
-        if any('react' in str(f).lower() for files in self.files_by_extension.values() for f in files):
-            suggestions.extend([
-                "Add React Testing Library tests for components",
-                "Implement proper state management with Redux/Zustand",
-                "Add accessibility improvements (ARIA labels, etc.)",
-                "Optimize bundle size and implement code splitting"
-            ])
+        # Framework-specific suggestions
+        if 'django' in self._path_hits:
+            yield self.DJANGO_SUGGESTIONS
+        if 'react' in self._path_hits:
+            yield self.REACT_SUGGESTIONS
         
         # General suggestions
-        suggestions.extend([
-            "Add comprehensive README with setup instructions",
-            "Implement CI/CD pipeline with GitHub Actions",
-            "Add security audit and vulnerability fixes",
-            "Create development environment setup scripts",
-            "Add performance monitoring and metrics",
-            "Implement database schema migrations",
-            "Add API rate limiting and caching",
-            "Create user documentation and examples"
-        ])
-        
-        # Show top 10 suggestions
-        for i, suggestion in enumerate(suggestions[:10], 1):
-            print(f"  {i:2}. {suggestion}")
-        
-        if len(suggestions) > 10:
-            print(f"     ... and {len(suggestions) - 10} more possibilities!")
+        yield self.GENERAL_SUGGESTIONS
     
     def get_complexity_score(self) -> Tuple[str, str]:
         """Get a complexity assessment of the repository."""
@@ -21,6 +21,8 @@ class OrchestratorHub:
         self.tasks: Dict[str, Task] = {}
         self.context_store: Dict[str, Context] = {}
         self.task_counter = 0
+        # Bumped on every change to tasks or contexts so views can be cached
+        self.version = 0
         
     def create_task(
         self,
@@ -49,6 +51,7 @@ class OrchestratorHub:
         )
         
         self.tasks[task_id] = task
+        self.version += 1
         logger.info(f"Created task {task_id}: {title}")
         
         return task_id
@@ -70,6 +73,7 @@ class OrchestratorHub:
         task.status = status
         if status == TaskStatus.COMPLETED:
             task.completed_at = datetime.now().isoformat()
+        self.version += 1
             
         logger.info(f"Updated task {task_id} status to {status.value}")
         return True
@@ -123,6 +127,7 @@ class OrchestratorHub:
         )
         
         self.context_store[context_id] = context
+        self.version += 1
         logger.info(f"Added context {context_id} to store")
         return True
 
@@ -205,6 +210,7 @@ class OrchestratorHub:
         task = self.get_task(task_id)
         if task:
             task.result = result
+            self.version += 1
             self.update_task_status(task_id, TaskStatus.COMPLETED)
         
         return result
@@ -16,6 +16,13 @@ from src.agents.actions.entities.actions import (
 )
 
 
+# A top-level block opens with <tag> at the start of a line and ends at the first </tag>;
+# anything in between, including other tags, is the block's content
+_OPEN_TAG_PATTERN = r'(?:^|\n)\s*<(\w+)>'
+_BLOCK_RE = re.compile(_OPEN_TAG_PATTERN + r'([\s\S]*?)</\1>', re.MULTILINE)
+_OPEN_TAG_RE = re.compile(_OPEN_TAG_PATTERN, re.MULTILINE)
+
+
 class SimpleActionParser:
     """Clean parser that delegates validation to Pydantic models."""
     
@@ -108,9 +115,7 @@ class SimpleActionParser:
     def _extract_xml_tags(self, response: str) -> List[Tuple[str, str]]:
         """Extract XML tag pairs from response."""
         # Match top-level tags (not nested)
-        pattern = r'(?:^|\n)\s*<(\w+)>([\s\S]*?)</\1>'
-        matches = re.findall(pattern, response, re.MULTILINE)
-        return matches
+        return _BLOCK_RE.findall(response)
     
     def _get_action_class_and_data(self, tag_name: str, data: dict) -> Tuple[Optional[Type[Action]], dict]:
         """Get the appropriate Action class and cleaned data for a tag.
@@ -193,4 +198,56 @@ message: "Task completed successfully"
         print(f"  - {action.__class__.__name__}: {action}")
     
     if errors:
-        print(f"Errors: {errors}")
\ No newline at end of file
+        print(f"Errors: {errors}")
+
+
+class FinishBlockDetector:
+    """Spots, in streamed text, the end of the first top-level <finish> block.
+    
+    Blocks are delimited as SimpleActionParser delimits them, so a "</finish>" quoted
+    inside another block (a file body, a heredoc) is content, not the end of a finish.
+    Only the unresolved tail of the text is kept between chunks.
+    """
+    
+    def __init__(self):
+        self._pending = ""
+        self._at_line_start = True
+        self._close_tag: Optional[str] = None
+        self._finish_closed = False
+    
+    def feed(self, chunk: str) -> bool:
+        """Add the next chunk; return True once a top-level finish block has closed."""
+        if self._finish_closed:
+            return True
+        self._pending += chunk
+        
+        while True:
+            if self._close_tag is not None:
+                # Inside a block: only its closing tag matters
+                end = self._pending.find(self._close_tag)
+                if end == -1:
+                    self._pending = self._pending[-(len(self._close_tag) - 1):]
+                    return False
+                if self._close_tag == "</finish>":
+                    self._finish_closed = True
+                    return True
+                self._pending = self._pending[end + len(self._close_tag):]
+                self._close_tag = None
+                self._at_line_start = False
+            
+            if not self._at_line_start:
+                # Blocks only open at the start of a line
+                newline = self._pending.find("\n")
+                if newline == -1:
+                    self._pending = ""
+                    return False
+                self._pending = self._pending[newline + 1:]
+                self._at_line_start = True
+            
+            match = _OPEN_TAG_RE.search(self._pending)
+            if match is None:
+                # A block can still open on the current, unfinished line
+                self._pending = self._pending[self._pending.rfind("\n") + 1:]
+                return False
+            self._close_tag = f"</{match.group(1)}>"
+            self._pending = self._pending[match.end():]
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 from dataclasses import dataclass, field
 
 from src.agents.env_interaction.entities.turn import Turn
@@ -9,22 +9,46 @@ class ConversationHistory:
     turns: List[Turn] = field(default_factory=list)
     max_turns: int = 100  # Keep last N turns to avoid context explosion
     
+    # Rendered prompt for the first _prompt_cache_len turns; to_prompt renders only newer ones
+    _prompt_cache: str = field(default="", init=False, repr=False, compare=False)
+    _prompt_cache_len: int = field(default=0, init=False, repr=False, compare=False)
+    _prompt_cache_last: Optional[Turn] = field(default=None, init=False, repr=False, compare=False)
+    
+    def _reset_prompt_cache(self):
+        self._prompt_cache = ""
+        self._prompt_cache_len = 0
+        self._prompt_cache_last = None
+    
     def add_turn(self, turn: Turn):
         """Add a turn to history, maintaining max size."""
         self.turns.append(turn)
         if len(self.turns) > self.max_turns:
             self.turns = self.turns[-self.max_turns:]
+            # Numbering shifts when old turns drop out, so the cache starts over
+            self._reset_prompt_cache()
     
     def to_prompt(self) -> str:
         """Convert history to prompt format."""
         if not self.turns:
             return "No previous interactions."
         
-        turn_strs = []
-        for i, turn in enumerate(self.turns, 1):
-            turn_strs.append(f"--- Turn {i} ---\n{turn.to_prompt()}")
+        cached = self._prompt_cache_len
+        if cached > len(self.turns) or (cached and self.turns[cached - 1] is not self._prompt_cache_last):
+            # Turns were replaced behind our back; render from scratch
+            self._reset_prompt_cache()
+            cached = 0
+        
+        if cached < len(self.turns):
+            turn_strs = []
+            for i, turn in enumerate(self.turns[cached:], cached + 1):
+                turn_strs.append(f"--- Turn {i} ---\n{turn.to_prompt()}")
+            
+            new_text = "\n\n".join(turn_strs)
+            self._prompt_cache = f"{self._prompt_cache}\n\n{new_text}" if cached else new_text
+            self._prompt_cache_len = len(self.turns)
+            self._prompt_cache_last = self.turns[-1]
         
-        return "\n\n".join(turn_strs)
+        return self._prompt_cache
 
 
     def to_dict(self) -> List[dict]:
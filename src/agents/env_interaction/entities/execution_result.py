@@ -16,7 +16,7 @@ class ExecutionResult:
     def to_dict(self) -> dict:
         """Convert execution result to dictionary format."""
         result = {
-            "actions_executed": [action.to_dict() for action in self.actions_executed],
+            "actions_executed": [action.model_dump() for action in self.actions_executed],
             "env_responses": self.env_responses,
             "has_error": self.has_error,
             "finish_message": self.finish_message,
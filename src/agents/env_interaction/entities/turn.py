@@ -14,22 +14,25 @@ class Turn:
         """Convert turn to dictionary format."""
         result = {
             "llm_output": self.llm_output,
-            "actions_executed": [action.to_dict() for action in self.actions_executed],
+            "actions_executed": [action.model_dump() for action in self.actions_executed],
             "env_responses": self.env_responses
         }
         if self.subagent_trajectories:
             result["subagent_trajectories"] = self.subagent_trajectories
         return result
     
+    def truncated_output(self, limit: int = 500) -> str:
+        """LLM output shortened to limit characters, for replaying in later prompts."""
+        if len(self.llm_output) > limit:
+            return f"{self.llm_output[:limit]}..."
+        return self.llm_output
+    
     def to_prompt(self) -> str:
         """Convert turn to prompt format for inclusion in state."""
         parts = []
         
         # Include LLM output (truncated if very long)
-        if len(self.llm_output) > 500:
-            parts.append(f"Agent: {self.llm_output[:500]}...")
-        else:
-            parts.append(f"Agent: {self.llm_output}")
+        parts.append(f"Agent: {self.truncated_output()}")
         
         # Include environment responses if any
         if self.env_responses:
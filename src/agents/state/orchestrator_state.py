@@ -1,5 +1,5 @@
 
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.agents.env_interaction.entities.conversation_history import ConversationHistory
 from src.agents.actions.orchestrator_hub import OrchestratorHub
@@ -13,6 +13,9 @@ class OrchestratorState:
         self.conversation_history = conversation_history
         self.done = False
         self.finish_message: Optional[str] = None
+        
+        # Rendered hub sections, reused until the hub's version changes
+        self._hub_prompt_cache: Optional[Tuple[int, str]] = None
     
     def to_dict(self) -> dict:
         """Convert orchestrator state to dictionary format."""
@@ -34,8 +37,28 @@ class OrchestratorState:
             "conversation_history": self.conversation_history.to_dict()
         }
     
-    def to_prompt(self) -> str:
-        """Convert complete state to prompt format for LLM."""
+    def to_prompt(self, include_history: bool = True) -> str:
+        """Convert complete state to prompt format for LLM.
+        
+        Args:
+            include_history: Whether to render the conversation history. Callers that
+                replay prior turns as chat messages pass False to avoid duplicating them.
+        """
+        sections = [self._hub_prompt()]
+        
+        # Add conversation history
+        if include_history:
+            sections.append("\n## Conversation History\n")
+            sections.append(self.conversation_history.to_prompt())
+        
+        return "\n".join(sections)
+    
+    def _hub_prompt(self) -> str:
+        """Render the task manager and context store sections."""
+        version = self.orchestrator_hub.version
+        if self._hub_prompt_cache is not None and self._hub_prompt_cache[0] == version:
+            return self._hub_prompt_cache[1]
+        
         sections = []
         
         # Add task manager state
@@ -44,8 +67,6 @@ class OrchestratorState:
         sections.append("\n## Context Store\n")
         sections.append(self.orchestrator_hub.view_context_store())
         
-        # Add conversation history
-        sections.append("\n## Conversation History\n")
-        sections.append(self.conversation_history.to_prompt())
-        
-        return "\n".join(sections)
+        rendered = "\n".join(sections)
+        self._hub_prompt_cache = (version, rendered)
+        return rendered
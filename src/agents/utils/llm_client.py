@@ -2,11 +2,12 @@
 
 import os
 import copy
+import functools
 import time
 import random
 import logging
 import threading
-from typing import List, Dict, Optional, Any
+from typing import Callable, List, Dict, Iterator, Optional, Any, Union
 
 import litellm
 from litellm.exceptions import InternalServerError
@@ -96,6 +97,50 @@ def _apply_anthropic_caching_if_possible(messages: List[Dict[str, Any]], model:
     return cached_messages
 
 
+# Called with (prompt_tokens, completion_tokens) when a response reports its usage
+UsageCallback = Callable[[int, int], None]
+
+
+def _report_usage(usage: Any, on_usage: Optional[UsageCallback]) -> None:
+    if on_usage is None or usage is None:
+        return
+    prompt_tokens = getattr(usage, "prompt_tokens", None)
+    completion_tokens = getattr(usage, "completion_tokens", None)
+    if prompt_tokens is not None and completion_tokens is not None:
+        on_usage(prompt_tokens, completion_tokens)
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_stream_usage(model: str) -> bool:
+    """Whether the provider accepts stream_options to report usage on a stream."""
+    try:
+        params = litellm.get_supported_openai_params(model=model)
+    except Exception:
+        return False
+    return "stream_options" in (params or [])
+
+
+def _iter_stream_text(stream: Any, on_usage: Optional[UsageCallback] = None) -> Iterator[str]:
+    """Yield the text deltas of a LiteLLM streaming response.
+    
+    Closing the generator early closes the underlying stream as well. Usage is
+    reported if a chunk carries it, which only happens once the stream is read
+    to the end.
+    """
+    try:
+        for chunk in stream:
+            _report_usage(getattr(chunk, "usage", None), on_usage)
+            if not chunk.choices:
+                continue
+            text = chunk.choices[0].delta.content
+            if text:
+                yield text
+    finally:
+        close = getattr(stream, "close", None)
+        if close is not None:
+            close()
+
+
 def get_llm_response(
     messages: List[Dict[str, Any]],
     model: Optional[str] = None,
@@ -103,8 +148,18 @@ def get_llm_response(
     max_tokens: int = 4096,
     api_key: Optional[str] = None,
     api_base: Optional[str] = None,
-    max_retries: int = 10
-) -> str:
+    max_retries: int = 10,
+    stream: bool = False,
+    on_usage: Optional[UsageCallback] = None
+) -> Union[str, Iterator[str]]:
+    """Get a completion from LiteLLM.
+    
+    With stream=True, returns an iterator of text chunks instead of the full string.
+    on_usage, if given, receives the provider-reported token usage; it is not
+    called when the provider reports none.
+    Retries only cover opening the stream, not errors raised while consuming it;
+    streaming callers should fall back to a non-streamed request on such errors.
+    """
     # Use provided params or fall back to env vars
     model = model or os.getenv("LITELLM_MODEL", None)
     if not model:
@@ -120,6 +175,10 @@ def get_llm_response(
     # Apply Anthropic caching if applicable
     processed_messages = _apply_anthropic_caching_if_possible(messages, model)
     
+    extra_params = {}
+    if stream and on_usage is not None and _supports_stream_usage(model):
+        extra_params["stream_options"] = {"include_usage": True}
+    
     # Retry logic with exponential backoff
     for attempt in range(max_retries):
         try:
@@ -129,7 +188,12 @@ def get_llm_response(
                 messages=processed_messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                stream=stream,
+                **extra_params,
             )
+            if stream:
+                return _iter_stream_text(response, on_usage)
+            _report_usage(getattr(response, "usage", None), on_usage)
             return response.choices[0].message.content # type: ignore
         
         except InternalServerError as e:
@@ -3,26 +3,158 @@
 Simple test to verify the basic structure is working.
 """
 
+import ast
+import os
+import re
+import sys
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
+_HERE = Path(__file__).resolve().parent
+_USAGE = _HERE / "USAGE.md"
+_ANALYZER = _HERE / "repo_analyzer.py"
+_CMD_EXECUTOR = _HERE / "src" / "agents" / "env_interaction" / "command_executor.py"
+
+_REQUIRED_FILES = (
+    "orchestrator_cli.py",
+    "orchestrator_config.py",
+    "orchestrator_standalone.py",
+    "repo_analyzer.py",
+    "USAGE.md",
+    "examples/basic_usage.py",
+    "examples/setup_examples.sh",
+)
+
+# (required path, OS-native parent directory, file name), split and joined once
+_REQUIRED = tuple(
+    (file_path, os.path.join(str(_HERE), *file_path.split("/")[:-1]), file_path.rpartition("/")[2])
+    for file_path in _REQUIRED_FILES
+)
+_REQUIRED_DIRS = tuple(dict.fromkeys(directory for _, directory, _ in _REQUIRED))
+
+
+def _canonical_args(signature: str) -> str:
+    """Normalize a parameter list as written in source to the form ast.unparse produces."""
+    return ast.unparse(ast.parse(f"def _({signature}): pass").body[0].args)
+
+
+# Classes the structure tests expect: (class name, base names, {method: parameter list}).
+# Parameter lists are written as in source and canonicalized once at import, so
+# spacing differences in either the expectation or the checked file don't matter.
+_CLASSES = {
+    name: (class_name, bases, {method: _canonical_args(args) for method, args in methods.items()})
+    for name, (class_name, bases, methods) in {
+        "local_executor": ("LocalExecutor", ("CommandExecutor",), {
+            "__init__": "self, working_directory: str = None",
+            "execute": "self, cmd: str, timeout: int = 30",
+        }),
+        "repo_analyzer": ("RepoAnalyzer", (), {
+            "analyze": "self",
+            "_scan_files": "self",
+            "_suggest_tasks": "self",
+        }),
+    }.items()
+}
+
+# Headings USAGE.md must have
+_USAGE_SECTIONS = (
+    "Quick Start",
+    "Installation",
+    "CLI Interface",
+    "Repository Analysis",
+    "Task Examples",
+    "Environment Variables",
+    "Troubleshooting",
+)
+
+# Markdown heading text, matched on the raw file bytes
+_HEADINGS_RE = re.compile(rb"(?m)^#+[ \t]+(.+?)[ \t\r]*$")
+
+
+def _slurp(path: str) -> bytes:
+    """Read a whole file with one os.read sized from fstat, bypassing buffered IO."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+
+
+@lru_cache(maxsize=None)
+def _read_bytes(path: str) -> bytes:
+    """Read a file once per session; several tests inspect the same sources."""
+    return _slurp(path)
+
+
+@lru_cache(maxsize=None)
+def _read(path: str) -> str:
+    """Decoded text of a file, for checks that depend on characters rather than bytes."""
+    return _read_bytes(path).decode("utf-8")
+
+
+@lru_cache(maxsize=None)
+def _ast(path: str) -> ast.Module:
+    """Parse a source file once per session."""
+    return ast.parse(_read_bytes(path), filename=path)
+
+
+def _missing_members(name: str, path: str) -> list:
+    """Return what the source at path lacks of the class described by _CLASSES[name]."""
+    class_name, bases, methods = _CLASSES[name]
+    classes = {node.name: node for node in _ast(path).body if isinstance(node, ast.ClassDef)}
+    cls = classes.get(class_name)
+    if cls is None or tuple(ast.unparse(base) for base in cls.bases) != bases:
+        return [f"class {class_name}({', '.join(bases)})" if bases else f"class {class_name}"]
+    
+    defined = {
+        node.name: ast.unparse(node.args)
+        for node in cls.body
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+    }
+    return [
+        f"{class_name}.{method}({args})"
+        for method, args in methods.items()
+        if defined.get(method) != args
+    ]
+
+
+def _listing(directory: str) -> dict:
+    """Map entry names to DirEntry objects; empty if the directory doesn't exist."""
+    try:
+        with os.scandir(directory) as it:
+            return {entry.name: entry for entry in it}
+    except FileNotFoundError:
+        return {}
+
+
+def _find_missing_files() -> list:
+    """Return the required files that aren't regular files, from one listing per directory."""
+    listings = {directory: _listing(directory) for directory in _REQUIRED_DIRS}
+    missing = []
+    for file_path, directory, name in _REQUIRED:
+        entry = listings[directory].get(name)
+        if entry is None or not entry.is_file():
+            missing.append(file_path)
+    return missing
+
+
+def _headings(content: bytes) -> set:
+    """Return the text of every Markdown heading in content."""
+    return {match.decode("utf-8") for match in _HEADINGS_RE.findall(content)}
+
 
 def test_local_executor_basic():
     """Test basic LocalExecutor functionality without full imports."""
     print("🧪 Testing basic LocalExecutor structure...")
     
     # Read the command executor file to verify our LocalExecutor class exists
-    cmd_executor_file = Path(__file__).parent / "src" / "agents" / "env_interaction" / "command_executor.py"
-    
-    if not cmd_executor_file.exists():
-        raise FileNotFoundError(f"Command executor file not found: {cmd_executor_file}")
-    
-    content = cmd_executor_file.read_text()
+    if not _CMD_EXECUTOR.exists():
+        raise FileNotFoundError(f"Command executor file not found: {_CMD_EXECUTOR}")
     
     # Check that our LocalExecutor class is defined
-    assert "class LocalExecutor(CommandExecutor):" in content
-    assert "def __init__(self, working_directory: str = None):" in content
-    assert "def execute(self, cmd: str, timeout: int = 30)" in content
+    missing = _missing_members("local_executor", str(_CMD_EXECUTOR))
+    assert not missing, f"Missing in command_executor.py: {missing}"
     
     print("✅ LocalExecutor class structure verified!")
 
@@ -31,26 +163,19 @@ def test_cli_files_exist():
     """Test that all CLI files exist."""
     print("🧪 Testing CLI files exist...")
     
-    base_dir = Path(__file__).parent
+    missing = _find_missing_files()
     
-    required_files = [
-        "orchestrator_cli.py",
-        "orchestrator_config.py", 
-        "orchestrator_standalone.py",
-        "repo_analyzer.py",
-        "USAGE.md",
-        "examples/basic_usage.py",
-        "examples/setup_examples.sh"
+    # Check that files are not empty
+    too_small = [
+        file_path
+        for file_path, directory, name in _REQUIRED
+        if file_path.endswith(".py")
+        and file_path not in missing
+        and os.stat(os.path.join(directory, name)).st_size <= 100
     ]
     
-    for file_path in required_files:
-        full_path = base_dir / file_path
-        assert full_path.exists(), f"Required file missing: {file_path}"
-        
-        # Check that files are not empty
-        if full_path.suffix == ".py":
-            content = full_path.read_text()
-            assert len(content) > 100, f"File {file_path} seems too small"
+    assert not missing, f"Required file missing: {', '.join(missing)}"
+    assert not too_small, f"File {', '.join(too_small)} seems too small"
     
     print("✅ All required CLI files exist and have content!")
 
@@ -59,14 +184,9 @@ def test_repo_analyzer_structure():
     """Test RepoAnalyzer structure without full imports."""
     print("🧪 Testing repo_analyzer structure...")
     
-    analyzer_file = Path(__file__).parent / "repo_analyzer.py"
-    content = analyzer_file.read_text()
-    
     # Check key components exist
-    assert "class RepoAnalyzer:" in content
-    assert "def analyze(self)" in content
-    assert "def _scan_files(self)" in content
-    assert "def _suggest_tasks(self)" in content
+    missing = _missing_members("repo_analyzer", str(_ANALYZER))
+    assert not missing, f"Missing in repo_analyzer.py: {missing}"
     
     print("✅ RepoAnalyzer structure verified!")
 
@@ -75,60 +195,58 @@ def test_usage_documentation():
     """Test that usage documentation exists and is comprehensive."""
     print("🧪 Testing usage documentation...")
     
-    usage_file = Path(__file__).parent / "USAGE.md"
-    content = usage_file.read_text()
+    content = _read_bytes(str(_USAGE))
     
     # Check key sections exist
-    required_sections = [
-        "Quick Start",
-        "Installation", 
-        "CLI Interface",
-        "Repository Analysis",
-        "Task Examples",
-        "Environment Variables",
-        "Troubleshooting"
-    ]
+    headings = _headings(content)
+    missing = [section for section in _USAGE_SECTIONS if section not in headings]
+    assert not missing, f"Missing section in USAGE.md: {', '.join(missing)}"
     
-    for section in required_sections:
-        assert section in content, f"Missing section in USAGE.md: {section}"
-    
-    # Check it has substantial content
-    assert len(content) > 5000, "USAGE.md seems too short"
+    # Check it has substantial content (in characters, so decode for this one)
+    assert len(_read(str(_USAGE))) > 5000, "USAGE.md seems too short"
     
     print("✅ Usage documentation verified!")
 
 
+_TESTS = (
+    test_cli_files_exist,
+    test_local_executor_basic,
+    test_repo_analyzer_structure,
+    test_usage_documentation,
+)
+
+
+_SUMMARY = (
+    "\n" + "=" * 50,
+    "✅ All basic structure tests passed!",
+    "🎉 The local usage functionality structure is correct!",
+    "",
+    "📋 What we've created:",
+    "• orchestrator_cli.py - Main CLI interface",
+    "• orchestrator_standalone.py - TerminalBench-free orchestrator",
+    "• orchestrator_config.py - Configuration management",
+    "• repo_analyzer.py - Repository analysis tool",
+    "• LocalExecutor - Local filesystem command execution",
+    "• USAGE.md - Comprehensive usage documentation",
+    "• examples/ - Usage examples and templates",
+    "",
+    "🚀 Ready to use! Set LITELLM_API_KEY and try:",
+    "python orchestrator_cli.py 'Add unit tests for core functionality'",
+)
+
+
 def main():
     """Run all tests."""
-    print("🚀 Testing Local Usage Functionality (Simple)")
-    print("=" * 50)
+    sys.stdout.write("🚀 Testing Local Usage Functionality (Simple)\n" + "=" * 50 + "\n")
     
     try:
-        test_cli_files_exist()
-        test_local_executor_basic()
-        test_repo_analyzer_structure()
-        test_usage_documentation()
-        
-        print("\n" + "=" * 50)
-        print("✅ All basic structure tests passed!")
-        print("🎉 The local usage functionality structure is correct!")
-        
-        print("\n📋 What we've created:")
-        print("• orchestrator_cli.py - Main CLI interface")
-        print("• orchestrator_standalone.py - TerminalBench-free orchestrator")
-        print("• orchestrator_config.py - Configuration management")
-        print("• repo_analyzer.py - Repository analysis tool")
-        print("• LocalExecutor - Local filesystem command execution")
-        print("• USAGE.md - Comprehensive usage documentation")
-        print("• examples/ - Usage examples and templates")
+        for test in _TESTS:
+            test()
         
-        print("\n🚀 Ready to use! Set LITELLM_API_KEY and try:")
-        print("python orchestrator_cli.py 'Add unit tests for core functionality'")
+        sys.stdout.write("\n".join(_SUMMARY) + "\n")
         
     except Exception as e:
-        print(f"\n❌ Test failed: {e}")
-        import traceback
-        traceback.print_exc()
+        sys.stderr.write(f"\n❌ Test failed: {type(e).__name__}: {e}\n")
         return 1
     
     return 0
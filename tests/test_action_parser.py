@@ -1,7 +1,7 @@
 #!/usr/bin/env python3
 """Comprehensive test suite for action parser and integration."""
 
-from src.agents.actions.parsing.parser import SimpleActionParser
+from src.agents.actions.parsing.parser import FinishBlockDetector, SimpleActionParser
 from src.agents.actions.entities.actions import (
     BashAction, FinishAction, BatchTodoAction,
     ReadAction, WriteAction, EditAction, MultiEditAction, FileMetadataAction,
@@ -521,4 +521,74 @@ if __name__ == "__main__":
     print("✓ TurnExecutor integration")
     
     print("\n✅ All tests passed!")
-    
\ No newline at end of file
+    
+
+
+class TestFinishBlockDetector:
+    """Test early detection of a completed top-level finish block in streamed text."""
+    
+    @staticmethod
+    def consumed(text, chunk_size):
+        """Feed text in chunks; return the prefix consumed when the detector fired, or None."""
+        detector = FinishBlockDetector()
+        for start in range(0, len(text), chunk_size):
+            end = start + chunk_size
+            if detector.feed(text[start:end]):
+                return text[:end]
+        return None
+    
+    def test_detects_finish_block(self):
+        """The detector fires in the chunk that closes the finish block."""
+        text = """<bash>
+cmd: "ls"
+</bash>
+
+<finish>
+message: "Done"
+</finish>
+Trailing text that is never needed."""
+        close = text.index("</finish>") + len("</finish>")
+        for chunk_size in (1, 3, 16, len(text)):
+            prefix = self.consumed(text, chunk_size)
+            assert prefix is not None
+            assert close <= len(prefix) < close + chunk_size
+            
+            actions, errors, _ = SimpleActionParser().parse_response(prefix)
+            assert [type(action) for action in actions] == [BashAction, FinishAction]
+            assert not errors
+    
+    def test_finish_tag_nested_in_other_action(self):
+        """A finish block quoted inside another action's content is not a finish."""
+        text = """<file>
+action: write
+file_path: "/tmp/prompt.md"
+content: |
+  Reply with:
+  <finish>
+  message: "quoted"
+  </finish>
+</file>
+
+<bash>
+cmd: "cat <<'EOF'\n</finish>\nEOF"
+</bash>
+"""
+        for chunk_size in (1, 5, len(text)):
+            assert self.consumed(text, chunk_size) is None
+        
+        real = text + """<finish>
+message: "Real finish"
+</finish>"""
+        prefix = self.consumed(real, 4)
+        assert prefix is not None
+        actions, errors, _ = SimpleActionParser().parse_response(prefix)
+        assert [type(action) for action in actions] == [WriteAction, BashAction, FinishAction]
+        assert "</finish>" in actions[0].content
+        assert actions[2].message == "Real finish"
+    
+    def test_finish_must_start_a_line(self):
+        """As in the parser, a tag that doesn't start a line doesn't open a block."""
+        text = 'Here is the syntax: <finish>message: "x"</finish> for later.\n'
+        assert self.consumed(text, 2) is None
+        assert self.consumed('<bash>cmd: "ls"</bash> <finish>x</finish>\n', 2) is None
+        assert self.consumed('<bash>cmd: "ls"</bash>\n  <finish>\nmessage: x\n</finish>', 2)
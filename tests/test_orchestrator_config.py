@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""Tests for orchestrator configuration loading and saving."""
+
+import os
+import stat
+
+import pytest
+
+from orchestrator_config import OrchestratorConfig, _atomic_write, _load_config_cached
+
+
+class TestAtomicWrite:
+    """Test suite for replacing config files in place."""
+    
+    def test_keeps_permission_bits(self, tmp_path):
+        """Test that rewriting a file keeps its mode instead of mkstemp's 0600."""
+        target = tmp_path / "config.json"
+        target.write_text("{}")
+        os.chmod(target, 0o644)
+        
+        _atomic_write(target, b'{"model": "x"}')
+        
+        assert target.read_bytes() == b'{"model": "x"}'
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o644
+    
+    def test_new_file_gets_umask_default(self, tmp_path):
+        """Test that a new file gets the mode open() would have created it with."""
+        target = tmp_path / "config.json"
+        umask = os.umask(0o022)
+        try:
+            _atomic_write(target, b"{}")
+        finally:
+            os.umask(umask)
+        
+        assert stat.S_IMODE(os.stat(target).st_mode) == 0o644
+    
+    def test_leaves_process_umask_alone(self, tmp_path, monkeypatch):
+        """Test that writing never changes the umask, which other threads rely on."""
+        def no_umask(mask):
+            raise AssertionError("os.umask called")
+        
+        monkeypatch.setattr(os, "umask", no_umask)
+        _atomic_write(tmp_path / "config.json", b"{}")
+    
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlink support")
+    def test_symlink_target_is_replaced(self, tmp_path):
+        """Test that a symlinked config stays a symlink and its target is rewritten."""
+        real_dir = tmp_path / "dotfiles"
+        real_dir.mkdir()
+        real = real_dir / "config.json"
+        real.write_text("{}")
+        link = tmp_path / "config.json"
+        link.symlink_to(real)
+        
+        _atomic_write(link, b'{"model": "x"}')
+        
+        assert link.is_symlink()
+        assert real.read_bytes() == b'{"model": "x"}'
+        assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+    
+    def test_save_round_trips(self, tmp_path):
+        """Test that save() output loads back into a fresh config."""
+        config_file = tmp_path / "nested" / "config.json"
+        config = OrchestratorConfig(config_file)
+        config.set("max_turns", 7)
+        config.save()
+        
+        assert OrchestratorConfig(config_file).get("max_turns") == 7
+
+
+class TestLoadCache:
+    """Test suite for the stat-keyed config parse cache."""
+    
+    def setup_method(self):
+        """Start each test from an empty parse cache."""
+        _load_config_cached.cache_clear()
+    
+    def test_unchanged_file_parsed_once(self, tmp_path):
+        """Test that loading an unchanged file again reuses the parsed result."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"max_turns": 3}')
+        
+        OrchestratorConfig(config_file)
+        OrchestratorConfig(config_file)
+        
+        info = _load_config_cached.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+    
+    def test_same_size_rewrite_invalidates(self, tmp_path):
+        """Test that an in-place rewrite of the same size and mtime is parsed again."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"max_turns": 3}')
+        st = os.stat(config_file)
+        assert OrchestratorConfig(config_file).get("max_turns") == 3
+        
+        config_file.write_text('{"max_turns": 4}')
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+        
+        assert OrchestratorConfig(config_file).get("max_turns") == 4
+    
+    def test_save_invalidates(self, tmp_path):
+        """Test that a config saved by another instance is picked up on the next load."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"max_turns": 3}')
+        assert OrchestratorConfig(config_file).get("max_turns") == 3
+        
+        writer = OrchestratorConfig(config_file)
+        writer.set("max_turns", 4)
+        writer.save()
+        
+        assert OrchestratorConfig(config_file).get("max_turns") == 4
+    
+    def test_cached_result_not_shared(self, tmp_path):
+        """Test that mutating one config's nested values can't leak into another."""
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"extra": {"tags": ["a"]}}')
+        
+        OrchestratorConfig(config_file).get("extra")["tags"].append("b")
+        
+        assert OrchestratorConfig(config_file).get("extra") == {"tags": ["a"]}
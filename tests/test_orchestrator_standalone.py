@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Tests for the standalone orchestrator's turn loop, with the LLM stubbed out."""
+
+import json
+import threading
+
+import pytest
+
+import orchestrator_standalone
+from orchestrator_standalone import StandaloneOrchestrator
+from src.agents.env_interaction.command_executor import LocalExecutor
+
+
+FINISH_RESPONSE = """<finish>
+message: "All done"
+</finish>"""
+
+BASH_RESPONSE = """<bash>
+cmd: "echo hello"
+</bash>"""
+
+
+class ScriptedLLM:
+    """Stands in for get_llm_response, replaying canned orchestrator responses.
+    
+    Summary requests are answered separately, and fail while summary_error is set.
+    The next stream_failures streams break after their first chunk. If usage is
+    set, every call reports it, as a provider would.
+    """
+    
+    def __init__(self, responses, default=FINISH_RESPONSE):
+        self.responses = list(responses)
+        self.default = default
+        self.requests = []
+        self.summary_prompts = []
+        self.summary_error = None
+        self.stream_failures = 0
+        self.streamed = []
+        self.usage = None
+        self.token_counts = []
+    
+    def __call__(self, messages, stream=False, on_usage=None, **kwargs):
+        report = (lambda: on_usage(*self.usage)) if self.usage and on_usage else (lambda: None)
+        if messages[0]["content"] == orchestrator_standalone._SUMMARY_SYSTEM_MESSAGE:
+            self.summary_prompts.append(messages[1]["content"])
+            if self.summary_error:
+                raise self.summary_error
+            report()
+            return f"summary #{len(self.summary_prompts)}"
+        
+        self.requests.append(messages)
+        response = self.responses.pop(0) if self.responses else self.default
+        self.streamed.append(stream)
+        if stream and self.stream_failures:
+            # The retried request gets the same response
+            self.stream_failures -= 1
+            self.responses.insert(0, response)
+            return self._broken_stream(response)
+        if stream:
+            return self._stream(response, report)
+        report()
+        return response
+    
+    @staticmethod
+    def _stream(response, report, chunk_size=7):
+        # A generator, like llm_client's stream, so it can be closed early; usage
+        # is only reported once it has been read to the end
+        for start in range(0, len(response), chunk_size):
+            yield response[start:start + chunk_size]
+        report()
+    
+    @staticmethod
+    def _broken_stream(response):
+        yield response[:7]
+        raise ConnectionError("connection dropped mid-stream")
+
+
+def counting_stub(calls, name):
+    """Token counter stand-in: one token per counted message, recording each call."""
+    roles = {
+        "count_input_tokens": {"system", "user"},
+        "count_output_tokens": {"assistant"},
+        "count_tokens_for_messages": {"system", "user", "assistant"},
+    }[name]
+    def count(messages, model=None):
+        calls.append((name, len(messages)))
+        return sum(1 for message in messages if message["role"] in roles)
+    return count
+
+
+@pytest.fixture
+def scripted_llm(monkeypatch):
+    def install(responses, default=FINISH_RESPONSE):
+        llm = ScriptedLLM(responses, default)
+        monkeypatch.setattr(orchestrator_standalone, "get_llm_response", llm)
+        for name in ("count_input_tokens", "count_output_tokens", "count_tokens_for_messages"):
+            monkeypatch.setattr(orchestrator_standalone, name, counting_stub(llm.token_counts, name))
+        return llm
+    # The memoized system message count must come from the stubs
+    orchestrator_standalone._sys_msg_tokens.cache_clear()
+    yield install
+    orchestrator_standalone._sys_msg_tokens.cache_clear()
+
+
+def make_orchestrator(tmp_path, logging_dir=None, window=None, interval=None):
+    orchestrator = StandaloneOrchestrator(model="test-model")
+    if window is not None:
+        orchestrator.history_window_k = window
+    if interval is not None:
+        orchestrator.summary_interval = interval
+    orchestrator.setup(LocalExecutor(str(tmp_path)), logging_dir=logging_dir)
+    return orchestrator
+
+
+class TestTurnLogging:
+    """Turn logs are written when a logging directory is configured."""
+    
+    def test_run_with_logging_dir_writes_every_turn(self, tmp_path, scripted_llm):
+        scripted_llm([BASH_RESPONSE, FINISH_RESPONSE])
+        logging_dir = tmp_path / "logs"
+        orchestrator = make_orchestrator(tmp_path, logging_dir=logging_dir)
+        
+        result = orchestrator.run("Say hello", max_turns=5)
+        
+        assert result["completed"] is True
+        assert result["finish_message"] == "All done"
+        assert result["turns_executed"] == 2
+        
+        log_files = sorted(logging_dir.glob("orchestrator_turn_*.json"))
+        assert [path.name for path in log_files] == [
+            "orchestrator_turn_001.json",
+            "orchestrator_turn_002.json",
+        ]
+        last = json.loads(log_files[-1].read_text())
+        assert last["done"] is True
+        # The newest user message of each turn is kept, so a failed turn can be replayed
+        assert "## Turn 1 Results\nEnv: " in last["user_message"]
+        assert "## Task Manager State" in last["user_message"]
+        # Actions in the snapshot are serialized from the pydantic models
+        first_turn = last["state_snapshot"]["conversation_history"][0]
+        assert first_turn["actions_executed"][0]["cmd"] == "echo hello"
+    
+    def test_logging_failure_does_not_abort_turn(self, tmp_path, scripted_llm, monkeypatch):
+        scripted_llm([FINISH_RESPONSE])
+        orchestrator = make_orchestrator(tmp_path, logging_dir=tmp_path / "logs")
+        
+        def broken_snapshot():
+            raise RuntimeError("snapshot failed")
+        monkeypatch.setattr(orchestrator.state, "to_dict", broken_snapshot)
+        
+        result = orchestrator.run("Finish immediately", max_turns=3)
+        
+        assert result["completed"] is True
+        assert result["turns_executed"] == 1
+    
+    def test_log_writer_stopped_after_run(self, tmp_path, scripted_llm):
+        scripted_llm([BASH_RESPONSE, FINISH_RESPONSE])
+        orchestrator = make_orchestrator(tmp_path, logging_dir=tmp_path / "logs")
+        
+        orchestrator.run("Say hello", max_turns=5)
+        
+        assert orchestrator._log_thread is None
+        assert not [t for t in threading.enumerate() if t.name == "orchestrator-turn-log"]
+    
+    def test_turns_after_close_start_a_new_writer(self, tmp_path, scripted_llm):
+        scripted_llm([BASH_RESPONSE, FINISH_RESPONSE])
+        logging_dir = tmp_path / "logs"
+        orchestrator = make_orchestrator(tmp_path, logging_dir=logging_dir)
+        
+        orchestrator.execute_turn("Say hello", 1)
+        orchestrator.close_logs()
+        orchestrator.execute_turn("Say hello", 2)
+        orchestrator.close_logs()
+        
+        assert len(list(logging_dir.glob("orchestrator_turn_*.json"))) == 2
+        assert orchestrator._log_thread is None
+
+
+class TestRequestMessages:
+    """Prior turns are replayed compactly; the hub state is sent once per request."""
+    
+    def test_hub_state_only_in_newest_message(self, tmp_path, scripted_llm):
+        llm = scripted_llm([BASH_RESPONSE, BASH_RESPONSE, BASH_RESPONSE, FINISH_RESPONSE])
+        orchestrator = make_orchestrator(tmp_path)
+        
+        orchestrator.run("Say hello", max_turns=10)
+        
+        assert len(llm.requests) == 4
+        for messages in llm.requests:
+            assert [m["role"] for m in messages[:2]] == ["system", "user"]
+            assert messages[1]["content"].startswith("## Current Task\nSay hello")
+            # Strictly alternating after the system message, ending on the new user message
+            roles = [m["role"] for m in messages[1:]]
+            assert roles == ["user", "assistant"] * (len(roles) // 2) + ["user"]
+            
+            with_state = [m for m in messages[1:] if "## Task Manager State" in m["content"]]
+            assert with_state == [messages[-1]]
+    
+    def test_replayed_turns_are_truncated_and_stable(self, tmp_path, scripted_llm):
+        long_response = "<think>\n" + "x" * 800 + "\n</think>\n" + BASH_RESPONSE
+        llm = scripted_llm([long_response, BASH_RESPONSE, FINISH_RESPONSE])
+        orchestrator = make_orchestrator(tmp_path)
+        
+        orchestrator.run("Say hello", max_turns=10)
+        
+        second, third = llm.requests[1], llm.requests[2]
+        replayed = second[2]["content"]
+        assert replayed == long_response[:500] + "..."
+        # Everything before the newest user message is resent unchanged
+        assert third[:3] == second[:3]
+        assert third[3]["content"] == orchestrator._render_results(1, orchestrator.conversation_history.turns[0])
+        assert third[3]["content"].startswith("## Turn 1 Results\nEnv: ")
+        assert "hello" in third[3]["content"]
+
+
+def replayed_turns(messages):
+    """Number of prior turns replayed in a request (one assistant message each)."""
+    return sum(1 for m in messages if m["role"] == "assistant")
+
+
+class TestRollingSummary:
+    """Older turns are folded into a rolling summary; recent ones are replayed."""
+    
+    def test_window_stays_bounded_across_many_turns(self, tmp_path, scripted_llm):
+        llm = scripted_llm([], default=BASH_RESPONSE)
+        orchestrator = make_orchestrator(tmp_path, window=2, interval=3)
+        
+        orchestrator.run("Keep going", max_turns=30)
+        
+        assert len(llm.requests) == 30
+        for turn_number, messages in enumerate(llm.requests, 1):
+            completed = turn_number - 1
+            if completed < 5:
+                assert replayed_turns(messages) == completed
+            else:
+                assert 2 <= replayed_turns(messages) <= 4
+        # One summary per interval once the first window filled up
+        assert len(llm.summary_prompts) == (29 - 5) // 3 + 1
+        assert "## Summary of Earlier Turns\nsummary #" in llm.requests[-1][1]["content"]
+    
+    def test_failed_summary_keeps_turns_until_summarized(self, tmp_path, scripted_llm):
+        llm = scripted_llm([], default=BASH_RESPONSE)
+        llm.summary_error = RuntimeError("summary service down")
+        orchestrator = make_orchestrator(tmp_path, window=2, interval=3)
+        
+        orchestrator.run("Keep going", max_turns=9)
+        
+        # Nothing was summarized, so every earlier turn is still replayed
+        assert orchestrator.rolling_summary == ""
+        assert replayed_turns(llm.requests[-1]) == 8
+        
+        llm.summary_error = None
+        orchestrator.state.done = False
+        orchestrator.run("Keep going", max_turns=1)
+        
+        # The recovered summary covers every held turn, and only the window remains
+        assert "--- Turn 1 ---" in llm.summary_prompts[-1]
+        assert "--- Turn 7 ---" in llm.summary_prompts[-1]
+        assert "--- Turn 8 ---" not in llm.summary_prompts[-1]
+        assert replayed_turns(llm.requests[-1]) == 2
+    
+    def test_summary_keeps_refreshing_past_history_cap(self, tmp_path, scripted_llm):
+        llm = scripted_llm([], default=BASH_RESPONSE)
+        orchestrator = make_orchestrator(tmp_path, window=2, interval=3)
+        # ConversationHistory only keeps its last max_turns turns
+        assert orchestrator.conversation_history.max_turns < 110
+        
+        orchestrator.run("Keep going", max_turns=110)
+        
+        assert len(llm.summary_prompts) == (109 - 5) // 3 + 1
+        assert "--- Turn 105 ---" in llm.summary_prompts[-1]
+        assert 2 <= replayed_turns(llm.requests[-1]) <= 4
+        assert llm.requests[-1][-1]["content"].startswith("## Turn 109 Results")
+
+
+class TestTokenCounting:
+    """Every request, summaries included, adds its full size to the token totals."""
+    
+    def test_counts_every_message_of_every_request(self, tmp_path, scripted_llm):
+        llm = scripted_llm([BASH_RESPONSE, BASH_RESPONSE, FINISH_RESPONSE])
+        orchestrator = make_orchestrator(tmp_path)
+        
+        orchestrator.run("Say hello", max_turns=5)
+        input_tokens, output_tokens = orchestrator.count_tokens()
+        
+        # One stub token per message sent: system, opening, then the replayed window
+        # and the new user message, which grows by two messages per turn
+        assert [len(messages) for messages in llm.requests] == [2, 4, 6]
+        assert input_tokens == 2 + 4 + 6
+        assert output_tokens == 3
+        # The totals are kept per request, so reading them counts nothing more
+        calls = len(llm.token_counts)
+        assert orchestrator.count_tokens() == (input_tokens, output_tokens)
+        assert len(llm.token_counts) == calls
+    
+    def test_prefers_provider_usage(self, tmp_path, scripted_llm):
+        llm = scripted_llm([BASH_RESPONSE, FINISH_RESPONSE])
+        llm.usage = (100, 10)
+        orchestrator = make_orchestrator(tmp_path)
+        
+        orchestrator.run("Say hello", max_turns=5)
+        
+        # The finish turn's stream is closed before its usage arrives, so that
+        # request falls back to counting its four messages and the response
+        assert orchestrator.count_tokens() == (100 + 4, 10 + 1)
+        assert len(llm.requests[1]) == 4
+    
+    def test_summary_requests_are_counted(self, tmp_path, scripted_llm):
+        llm = scripted_llm([], default=BASH_RESPONSE)
+        llm.usage = (100, 10)
+        orchestrator = make_orchestrator(tmp_path, window=2, interval=2)
+        
+        orchestrator.run("Keep going", max_turns=8)
+        
+        calls = len(llm.requests) + len(llm.summary_prompts)
+        assert llm.summary_prompts
+        assert orchestrator.count_tokens() == (100 * calls, 10 * calls)
+
+
+class TestStreaming:
+    """The response stream is closed early only after a real top-level finish block."""
+    
+    def test_finish_quoted_in_file_content_is_not_cut(self, tmp_path, scripted_llm):
+        target = tmp_path / "notes.md"
+        write_response = f"""<file>
+action: write
+file_path: "{target}"
+content: |
+  Close with:
+  </finish>
+  and nothing else.
+</file>"""
+        llm = scripted_llm([write_response, FINISH_RESPONSE + "\nIgnored trailing text"])
+        orchestrator = make_orchestrator(tmp_path)
+        
+        result = orchestrator.run("Write notes", max_turns=5)
+        
+        assert result["turns_executed"] == 2
+        assert target.read_text().rstrip("\n") == "Close with:\n</finish>\nand nothing else."
+        assert orchestrator.conversation_history.turns[0].llm_output == write_response
+        # The finish turn's stream was closed before the trailing text was read
+        assert "Ignored trailing text" not in orchestrator.conversation_history.turns[1].llm_output
+    
+    def test_failed_stream_retried_without_streaming(self, tmp_path, scripted_llm):
+        llm = scripted_llm([BASH_RESPONSE, FINISH_RESPONSE])
+        llm.stream_failures = 1
+        orchestrator = make_orchestrator(tmp_path)
+        
+        result = orchestrator.run("Say hello", max_turns=5)
+        
+        assert result["completed"] is True
+        assert result["turns_executed"] == 2
+        # The broken stream's partial text is discarded, not executed
+        assert orchestrator.conversation_history.turns[0].llm_output == BASH_RESPONSE
+        assert llm.streamed == [True, False, True]
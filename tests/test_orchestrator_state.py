@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Tests for rendering orchestrator state into the prompt."""
+
+from src.agents.actions.entities.subagent_report import ContextItem, SubagentReport
+from src.agents.actions.orchestrator_hub import OrchestratorHub
+from src.agents.env_interaction.entities.conversation_history import ConversationHistory
+from src.agents.state.orchestrator_state import OrchestratorState
+from src.agents.actions.entities.task import TaskStatus
+
+
+def make_state():
+    return OrchestratorState(OrchestratorHub(), ConversationHistory())
+
+
+def add_task(hub, title="Explore"):
+    return hub.create_task("explorer", title, "Look around", [], [])
+
+
+class TestHubPromptCache:
+    """Test suite for reusing the rendered task manager and context store."""
+    
+    def test_reused_while_hub_unchanged(self, monkeypatch):
+        """Test that the hub sections are rendered once until the hub changes."""
+        state = make_state()
+        add_task(state.orchestrator_hub)
+        calls = []
+        view_all_tasks = state.orchestrator_hub.view_all_tasks
+        monkeypatch.setattr(
+            state.orchestrator_hub, "view_all_tasks",
+            lambda: calls.append(1) or view_all_tasks()
+        )
+        
+        first = state.to_prompt(include_history=False)
+        assert state.to_prompt(include_history=False) == first
+        assert len(calls) == 1
+    
+    def test_create_task_invalidates(self):
+        """Test that a new task shows up in the next prompt."""
+        state = make_state()
+        state.to_prompt()
+        add_task(state.orchestrator_hub, "Find the config loader")
+        
+        assert "Find the config loader" in state.to_prompt()
+    
+    def test_status_update_invalidates(self):
+        """Test that a task status change shows up in the next prompt."""
+        state = make_state()
+        task_id = add_task(state.orchestrator_hub)
+        before = state.to_prompt()
+        state.orchestrator_hub.update_task_status(task_id, TaskStatus.FAILED)
+        
+        after = state.to_prompt()
+        assert after != before
+        assert "failed" in after.lower()
+    
+    def test_add_context_invalidates(self):
+        """Test that a new context shows up in the next prompt."""
+        state = make_state()
+        state.to_prompt()
+        state.orchestrator_hub.add_context("ctx_1", "Config lives in ~/.orchestrator", "task_001")
+        
+        assert "Config lives in ~/.orchestrator" in state.to_prompt()
+    
+    def test_subagent_result_invalidates(self):
+        """Test that a processed subagent report shows its contexts and result."""
+        state = make_state()
+        task_id = add_task(state.orchestrator_hub)
+        state.to_prompt()
+        report = SubagentReport(
+            contexts=[ContextItem(id="found", content="Entry point is cli.py")],
+            comments="Done exploring",
+        )
+        state.orchestrator_hub.process_subagent_result(task_id, report)
+        
+        prompt = state.to_prompt()
+        assert "Entry point is cli.py" in prompt
+        assert "Done exploring" in prompt
+    
+    def test_rejected_change_keeps_cache(self):
+        """Test that a no-op update (unknown task, duplicate context) keeps the version."""
+        hub = OrchestratorHub()
+        hub.add_context("ctx_1", "first", "task_001")
+        version = hub.version
+        
+        assert not hub.update_task_status("task_999", TaskStatus.COMPLETED)
+        assert not hub.add_context("ctx_1", "second", "task_001")
+        assert hub.version == version
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Tests for the repository analyzer's file walk and line counting."""
+
+import os
+
+import pytest
+
+import repo_analyzer
+from repo_analyzer import RepoAnalyzer
+
+
+def write(root, rel_path, content="x = 1\n"):
+    """Create a file under root, with parent directories."""
+    path = root / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+    return path
+
+
+def walked(analyzer):
+    """Relative paths yielded by _walk_files, sorted."""
+    prefix = os.path.join(str(analyzer.repo_path), "")
+    return sorted(entry.path[len(prefix):].replace(os.sep, "/") for entry in analyzer._walk_files())
+
+
+class TestWalkFiles:
+    """Test suite for the scandir-based repository walk."""
+    
+    def test_matches_os_walk(self, tmp_path):
+        """Test that the walk finds the same files os.walk does."""
+        for rel_path in ("a.py", "pkg/b.py", "pkg/sub/c.py", "z/d.py"):
+            write(tmp_path, rel_path)
+        analyzer = RepoAnalyzer(tmp_path)
+        
+        expected = []
+        for dirpath, dirnames, filenames in os.walk(analyzer.repo_path):
+            dirnames[:] = [d for d in dirnames if d not in RepoAnalyzer.IGNORE_DIRS]
+            expected.extend(os.path.join(dirpath, name) for name in filenames)
+        
+        assert sorted(entry.path for entry in analyzer._walk_files()) == sorted(expected)
+    
+    def test_skips_ignored_dirs(self, tmp_path):
+        """Test that IGNORE_DIRS are not descended into."""
+        write(tmp_path, "main.py")
+        write(tmp_path, "node_modules/lib/index.js")
+        write(tmp_path, ".git/config", "[core]\n")
+        write(tmp_path, "src/__pycache__/main.cpython-312.pyc")
+        
+        assert walked(RepoAnalyzer(tmp_path)) == ["main.py"]
+    
+    @pytest.mark.skipif(not hasattr(os, "symlink"), reason="needs symlink support")
+    def test_does_not_follow_symlinked_dirs(self, tmp_path):
+        """Test that a symlinked directory is not walked, as with os.walk."""
+        outside = tmp_path / "outside"
+        write(outside, "secret.py")
+        repo = tmp_path / "repo"
+        write(repo, "main.py")
+        (repo / "linked").symlink_to(outside, target_is_directory=True)
+        
+        assert walked(RepoAnalyzer(repo)) == ["main.py"]
+
+
+class TestLineCountFilters:
+    """Test suite for which files are line-counted during a scan."""
+    
+    def test_generated_files_listed_but_not_counted(self, tmp_path):
+        """Test that bundles and lockfiles are listed but add no lines."""
+        write(tmp_path, "app.js", "a();\nb();\n")
+        write(tmp_path, "static/vendor.min.js", "x();\n" * 50)
+        write(tmp_path, "package-lock.json", "{}\n")
+        analyzer = RepoAnalyzer(tmp_path)
+        analyzer._scan_files()
+        
+        assert sorted(analyzer.files_by_extension[".js"]) == ["app.js", os.path.join("static", "vendor.min.js")]
+        assert analyzer.languages["JavaScript"] == 2
+        assert analyzer.total_lines == 2
+    
+    def test_generated_patterns_ignore_case(self, tmp_path):
+        """Test that generated-file patterns match regardless of case."""
+        write(tmp_path, "Bundle.MIN.JS", "x();\n")
+        analyzer = RepoAnalyzer(tmp_path)
+        
+        entry = next(analyzer._walk_files())
+        assert not analyzer._should_count_lines(entry)
+    
+    def test_max_scan_bytes(self, tmp_path):
+        """Test that files over max_scan_bytes are listed but not counted."""
+        write(tmp_path, "small.py", "a = 1\n")
+        write(tmp_path, "big.py", "b = 2\n" * 100)
+        analyzer = RepoAnalyzer(tmp_path, max_scan_bytes=100)
+        analyzer._scan_files()
+        
+        assert sorted(analyzer.files_by_extension[".py"]) == ["big.py", "small.py"]
+        assert analyzer.languages["Python"] == 1
+
+
+class TestCountLines:
+    """Test suite for line counting and fanning it out to worker pools."""
+    
+    def test_counts_unterminated_last_line(self, tmp_path):
+        """Test that line counts match len(readlines()) for a file without a final newline."""
+        path = write(tmp_path, "a.py", "one\ntwo\nthree")
+        
+        with open(path) as f:
+            assert repo_analyzer._count_lines(path) == len(f.readlines()) == 3
+    
+    def test_thread_fallback_when_processes_fail(self, tmp_path, monkeypatch):
+        """Test that a process pool that can't start falls back to threads, keeping order."""
+        paths = [str(write(tmp_path, f"m{i}.py", "x\n" * (i % 5 + 1))) for i in range(12)]
+        
+        def no_processes(*args, **kwargs):
+            raise OSError("no multiprocessing here")
+        
+        monkeypatch.setattr(repo_analyzer, "ProcessPoolExecutor", no_processes)
+        monkeypatch.setattr(RepoAnalyzer, "PARALLEL_MIN_FILES", 1)
+        
+        counts = RepoAnalyzer(tmp_path)._count_lines_all(paths)
+        assert counts == [i % 5 + 1 for i in range(12)]
+    
+    def test_unreadable_file_counts_as_none(self, tmp_path):
+        """Test that a file vanishing before it is counted yields None, not an error."""
+        missing = str(tmp_path / "gone.py")
+        present = str(write(tmp_path, "here.py", "a\nb\n"))
+        
+        assert RepoAnalyzer(tmp_path)._count_lines_all([missing, present]) == [None, 2]